@@ -10,10 +10,13 @@ Usage:
     python scripts/generate_new_figures.py
 """
 
+import os
 import sys
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from itertools import combinations
+from types import SimpleNamespace
 
 import numpy as np
 import pandas as pd
@@ -38,6 +41,12 @@ try:
 except ImportError:
     HAS_STATSMODELS = False
 
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 from scipy import stats as sp_stats
 from scipy.cluster.hierarchy import dendrogram, linkage
 
@@ -50,7 +59,32 @@ warnings.filterwarnings("ignore", category=UserWarning)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 MERGED_CSV = BASE_DIR / "data" / "processed" / "all_players.csv"
+MERGED_PARQUET = BASE_DIR / "data" / "processed" / "all_players.parquet"
 FIGURES_DIR = BASE_DIR / "figures"
+
+# Explicit dtypes for the CSV fallback: skips float64 inference and the
+# columns no figure reads (DOB, sources, notes). batting_position,
+# birth_year and era use nullable Int dtypes because the validator
+# permits null there, and a plain int dtype would raise on a legal file.
+CSV_DTYPES = {
+    "player_id": "object",
+    "full_name": "object",
+    "country": "object",
+    "category": "object",
+    "batting_position": "Int8",
+    "birth_year": "Int16",
+    "age_at_tournament": "float32",
+    "height_cm": "float32",
+    "height_verified": "object",
+    "pop_height_birth_cohort": "float32",
+    "flag": "object",
+    "tournament_id": "object",
+    "format": "object",
+    "tournament_year": "int16",
+    "era": "Int16",
+    "height_excess": "float32",
+    "region": "object",
+}
 DPI = 300
 
 CATEGORY_COLORS = {
@@ -79,6 +113,22 @@ COUNTRY_NAMES = {
 
 NATION_ORDER = ["AUS", "ENG", "NZL", "RSA", "WI", "IND", "PAK", "SL"]
 
+# Lookup arrays aligned with NATION_ORDER, built once so figures can index
+# by categorical codes instead of doing per-element dict lookups
+NATION_ORDER_ARR = np.array(NATION_ORDER)
+COUNTRY_NAME_ARR = np.array([COUNTRY_NAMES[c] for c in NATION_ORDER])
+COUNTRY_COLOR_ARR = np.array([COUNTRY_COLORS[c] for c in NATION_ORDER], dtype=object)
+
+
+def country_names_colors(countries):
+    """Map country codes to (display names, colors) via NATION_ORDER codes."""
+    countries = np.asarray(countries, dtype=str)
+    codes = pd.Categorical(countries, categories=NATION_ORDER).codes
+    known = codes >= 0
+    names = np.where(known, COUNTRY_NAME_ARR[codes], countries)
+    colors = np.where(known, COUNTRY_COLOR_ARR[codes], "#999999")
+    return names, colors
+
 REGION_COLORS = {
     "South Asian": "#E69F00",
     "Oceanian": "#0072B2",
@@ -93,6 +143,68 @@ ERA_LABELS = {
 
 FORMAT_COLORS = {"ODI": "#0072B2", "T20": "#D55E00"}
 
+# Sampled once at module load instead of re-sampling the colormap per figure
+SET3_PALETTE = plt.cm.Set3(np.arange(8) / 8)
+
+
+# Aggregates shared by several figures, built once per process. All
+# figures operate on the same df_valid frame, so a single cache is safe.
+_shared_ctx = None
+
+
+def get_ctx(df) -> SimpleNamespace:
+    """Return shared aggregates (built lazily, reused across figures)."""
+    global _shared_ctx
+    if _shared_ctx is None:
+        _shared_ctx = SimpleNamespace(
+            # tournament_year x category record counts
+            year_cat=df.groupby(["tournament_year", "category"],
+                                observed=False).size().unstack(fill_value=0),
+            # per-team (tournament, country) summary used by fig18/fig31
+            team_agg=df.groupby(["tournament_id", "country"], observed=True).agg(
+                mean_height=("height_cm", "mean"),
+                sd_height=("height_cm", "std"),
+                min_height=("height_cm", "min"),
+                max_height=("height_cm", "max"),
+                n_fast=("is_fast", "sum"),
+                tournament_year=("tournament_year", "first"),
+                region=("region", "first"),
+            ).reset_index(),
+            # one row per player (first record wins), for career-level views
+            unique_players=df.drop_duplicates(subset="player_id"),
+        )
+    return _shared_ctx
+
+
+# Reusable Figure objects keyed by (rows, cols, figsize). Creating and
+# tearing down a Figure per plot allocates a fresh canvas and axes each
+# time; clearing and re-subplotting the same object avoids that churn
+# (the cache is per process, so it composes with the worker pool).
+_FIG_CACHE = {}
+
+
+def get_fig(rows, cols, figsize):
+    """Return a cleared, reusable (fig, axes) pair for the given layout."""
+    key = (rows, cols, figsize)
+    fig = _FIG_CACHE.get(key)
+    if fig is None:
+        fig = _FIG_CACHE.setdefault(key, plt.figure(figsize=figsize))
+    fig.clear()
+    axes = fig.subplots(rows, cols)
+    return fig, axes
+
+
+def short_surnames(names) -> np.ndarray:
+    """Vectorized label shortener: last name token, truncated to 8 chars + '..'.
+
+    Replaces per-row split()/len()/slice loops when annotating many players.
+    """
+    names = np.asarray(names, dtype=str)
+    last = np.char.rpartition(names, " ")[:, 2]
+    last = np.where(last == "", names, last)
+    return np.where(np.char.str_len(last) > 10,
+                    np.char.add(last.astype("<U8"), ".."), last)
+
 
 def setup_style():
     if HAS_SEABORN:
@@ -156,9 +268,10 @@ def fig12_height_arms_race(df):
 
     fig.suptitle("The Height Arms Race: How Each Nation's Selection Has Evolved",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig12_height_arms_race.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -242,9 +355,10 @@ def fig13_tallest_vs_shortest_xi(df):
     fig.suptitle("Tournament Team Heights: Every Playing XI Ranked\n"
                  "(Blue = shortest XI ever, Red = tallest XI ever)",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig13_tallest_vs_shortest_xi.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -332,9 +446,10 @@ def fig14_batting_position_height_profile(df):
 
     fig.suptitle("The Shape of a Cricket Team: Height by Batting Position",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig14_batting_position_profile.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -414,9 +529,10 @@ def fig15_fast_bat_gap(df):
 
     fig.suptitle("The Fast Bowler Premium: Height Gap Over Batsmen Within Teams",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig15_fast_bat_gap.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -498,9 +614,10 @@ def fig16_age_height_relationship(df):
 
     fig.suptitle("Age, Generations, and Selection: The Demographic Engine",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig16_age_height_demographics.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -582,9 +699,10 @@ def fig17_wicketkeeper_paradox(df):
 
     fig.suptitle("The Wicketkeeper Paradox: Shortest Category, Still Selected for Height",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig17_wicketkeeper_paradox.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -597,14 +715,9 @@ def fig18_team_height_diversity(df):
     """Within-team height standard deviation over time by country."""
     fig, axes = plt.subplots(1, 2, figsize=(16, 7))
 
-    # Calculate per-team SD
-    team_stats = df.groupby(["tournament_id", "country"]).agg(
-        mean_height=("height_cm", "mean"),
-        sd_height=("height_cm", "std"),
-        range_height=("height_cm", lambda x: x.max() - x.min()),
-        tournament_year=("tournament_year", "first"),
-        region=("region", "first"),
-    ).reset_index()
+    # Per-team SD/range from the shared aggregate
+    team_stats = get_ctx(df).team_agg.copy()
+    team_stats["range_height"] = team_stats["max_height"] - team_stats["min_height"]
 
     # Panel A: Team SD over time
     ax = axes[0]
@@ -655,9 +768,10 @@ def fig18_team_height_diversity(df):
 
     fig.suptitle("Team Height Diversity: Are Teams Becoming More or Less Uniform?",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig18_team_height_diversity.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -734,9 +848,10 @@ def fig19_spin_vs_fast_by_country(df):
 
     fig.suptitle("The Spin vs Pace Height Story: Subcontinent vs Pace Nations",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig19_spin_vs_fast.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -812,9 +927,10 @@ def fig20_career_span_giants(df):
 
     fig.suptitle("Career Span Giants: Do Taller Players Last Longer on the World Stage?",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig20_career_span_giants.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -901,9 +1017,10 @@ def fig21_south_asian_catchup(df):
 
     fig.suptitle("The South Asian Catch-Up: Convergence in Cricket's Height Selection",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig21_south_asian_catchup.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -963,9 +1080,10 @@ def fig22_ridgeline_decades(df):
     # Remove y-axis spine
     ax.spines["left"].set_visible(False)
 
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig22_ridgeline_decades.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -976,7 +1094,7 @@ def fig22_ridgeline_decades(df):
 # ===================================================================
 def fig23_allrounder_effect(df):
     """Height of ambiguous (all-rounder) players vs clear role players."""
-    fig, axes = plt.subplots(1, 2, figsize=(14, 6))
+    fig, axes = get_fig(1, 2, (14, 6))
 
     # Panel A: Ambiguous vs non-ambiguous height distributions
     ax = axes[0]
@@ -987,18 +1105,31 @@ def fig23_allrounder_effect(df):
     clear = df_copy[~df_copy["is_ambiguous"]]["height_cm"].dropna()
 
     if len(ambig) > 5:
-        data_to_plot = [clear.values, ambig.values]
+        data_to_plot = [clear.to_numpy(), ambig.to_numpy()]
         labels = [f"Clear Role\n(n={len(clear)})", f"Ambiguous/All-Rounder\n(n={len(ambig)})"]
         colors = ["#3498db", "#e74c3c"]
 
-        bp = ax.boxplot(data_to_plot, labels=labels, patch_artist=True,
-                        widths=0.5, flierprops=dict(markersize=3))
+        # Precompute box stats with numpy quantiles and draw via ax.bxp,
+        # skipping matplotlib's per-array Python stats pass
+        bxpstats = []
+        for arr, label in zip(data_to_plot, labels):
+            lo, q1, med, q3, hi = np.quantile(arr, [0.0, 0.25, 0.5, 0.75, 1.0])
+            bxpstats.append({"label": label, "med": med, "q1": q1, "q3": q3,
+                             "whislo": lo, "whishi": hi, "fliers": []})
+        bp = ax.bxp(bxpstats, patch_artist=True, widths=0.5)
         for patch, color in zip(bp["boxes"], colors):
             patch.set_facecolor(color)
             patch.set_alpha(0.7)
 
-        # t-test
-        t_stat, p_val = sp_stats.ttest_ind(clear, ambig)
+        # Pooled-variance t-test from sufficient statistics -- same result
+        # as sp_stats.ttest_ind without rescanning the height arrays
+        n1, n2 = data_to_plot[0].size, data_to_plot[1].size
+        m1, m2 = data_to_plot[0].mean(), data_to_plot[1].mean()
+        v1 = data_to_plot[0].var(ddof=1)
+        v2 = data_to_plot[1].var(ddof=1)
+        pooled_var = ((n1 - 1) * v1 + (n2 - 1) * v2) / (n1 + n2 - 2)
+        t_stat = (m1 - m2) / np.sqrt(pooled_var * (1 / n1 + 1 / n2))
+        p_val = 2 * sp_stats.t.sf(abs(t_stat), n1 + n2 - 2)
         ax.text(0.5, 0.95, f"t = {t_stat:.2f}, p = {p_val:.3f}",
                 transform=ax.transAxes, ha="center", va="top", fontsize=10,
                 bbox=dict(boxstyle="round,pad=0.3", fc="lightyellow", alpha=0.9, ec="gray"))
@@ -1036,10 +1167,11 @@ def fig23_allrounder_effect(df):
 
     fig.suptitle("The All-Rounder Effect: Do Multi-Skilled Players Have a Different Height Profile?",
                  fontsize=14, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig23_allrounder_effect.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1061,7 +1193,7 @@ def fig24_team_silhouettes(df):
         ("odi-2023", "AUS", "Australia 2023"),
     ]
 
-    fig, axes = plt.subplots(2, 4, figsize=(20, 10))
+    fig, axes = get_fig(2, 4, (20, 10))
     axes = axes.flatten()
 
     for idx, (tid, country, label) in enumerate(iconic_teams):
@@ -1083,11 +1215,9 @@ def fig24_team_silhouettes(df):
         bars = ax.bar(positions, heights, color=bar_colors, edgecolor="white",
                       width=0.7, zorder=3)
 
-        # Add player name labels (rotated)
-        for pos, h, name, cat in zip(positions, heights, names, categories):
-            short_name = name.split()[-1] if " " in name else name
-            if len(short_name) > 10:
-                short_name = short_name[:8] + ".."
+        # Add player name labels (rotated); names shortened in one
+        # vectorized pass rather than per-player string ops
+        for pos, h, short_name in zip(positions, heights, short_surnames(names)):
             ax.text(pos, h + 0.5, short_name, ha="center", va="bottom",
                     fontsize=6, rotation=45, fontweight="bold")
 
@@ -1111,10 +1241,11 @@ def fig24_team_silhouettes(df):
 
     fig.suptitle("Height Silhouettes of Iconic World Cup XIs\n(Each bar = one player, ordered by batting position)",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig24_team_silhouettes.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1124,7 +1255,7 @@ def fig24_team_silhouettes(df):
 # ===================================================================
 def fig25_height_thresholds(df):
     """Percentage of players exceeding height thresholds over time."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 12))
+    fig, axes = get_fig(2, 2, (14, 12))
 
     # Panel A: % above 180cm over time (all players)
     ax = axes[0, 0]
@@ -1135,7 +1266,8 @@ def fig25_height_thresholds(df):
             lambda x: (x >= threshold).sum() / len(x) * 100
         )
         ax.plot(pct.index, pct.values, "o-", color=color,
-                label=f">= {threshold} cm", markersize=4, linewidth=1.5)
+                label=f">= {threshold} cm", markersize=4, linewidth=1.5,
+                rasterized=True)
     ax.set_xlabel("Tournament Year")
     ax.set_ylabel("% of Players")
     ax.set_title("A. Players Exceeding Height Thresholds Over Time")
@@ -1150,7 +1282,7 @@ def fig25_height_thresholds(df):
             lambda x: (x >= 185).sum() / len(x) * 100
         )
         ax.plot(pct.index, pct.values, "o-", color=CATEGORY_COLORS[cat],
-                label=cat, markersize=4, linewidth=1.5)
+                label=cat, markersize=4, linewidth=1.5, rasterized=True)
     ax.set_xlabel("Tournament Year")
     ax.set_ylabel("% of Players >= 185 cm")
     ax.set_title("B. '6-Foot Club' (185cm+) by Category")
@@ -1166,7 +1298,8 @@ def fig25_height_thresholds(df):
         )
         if len(pct) >= 3:
             ax.plot(pct.index, pct.values, "o-", color=COUNTRY_COLORS[country],
-                    label=COUNTRY_NAMES[country], markersize=3, linewidth=1.2, alpha=0.8)
+                    label=COUNTRY_NAMES[country], markersize=3, linewidth=1.2,
+                    alpha=0.8, rasterized=True)
     ax.set_xlabel("Tournament Year")
     ax.set_ylabel("% of Players >= 180 cm")
     ax.set_title("C. '180 Club' Membership by Country")
@@ -1178,7 +1311,7 @@ def fig25_height_thresholds(df):
     tallest = df.loc[df.groupby("tournament_year")["height_cm"].idxmax()]
     tallest = tallest.sort_values("tournament_year")
 
-    bar_colors = [COUNTRY_COLORS.get(c, "#999") for c in tallest["country"]]
+    _, bar_colors = country_names_colors(tallest["country"])
     bars = ax.bar(range(len(tallest)), tallest["height_cm"].values,
                   color=bar_colors, edgecolor="white", width=0.7)
 
@@ -1191,11 +1324,12 @@ def fig25_height_thresholds(df):
     ax.set_xticks(range(len(tallest)))
     ax.set_xticklabels(labels, fontsize=6, rotation=45, ha="right")
 
-    # Annotate with player name
-    for i, (_, row) in enumerate(tallest.iterrows()):
-        name = row["full_name"].split()[-1] if " " in row["full_name"] else row["full_name"]
-        ax.text(i, row["height_cm"] + 0.5,
-                f'{name}\n({row["country"]})\n{row["height_cm"]:.0f}cm',
+    # Annotate with player name (short names precomputed in bulk)
+    surnames = short_surnames(tallest["full_name"].to_numpy())
+    countries_arr = tallest["country"].to_numpy()
+    heights_arr = tallest["height_cm"].to_numpy()
+    for i, (name, ctry, h) in enumerate(zip(surnames, countries_arr, heights_arr)):
+        ax.text(i, h + 0.5, f"{name}\n({ctry})\n{h:.0f}cm",
                 ha="center", fontsize=6, fontweight="bold", va="bottom")
 
     ax.set_ylabel("Height (cm)")
@@ -1204,10 +1338,11 @@ def fig25_height_thresholds(df):
 
     fig.suptitle("The Height Threshold Revolution: How the Tall End Is Growing",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig25_height_thresholds.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1217,7 +1352,7 @@ def fig25_height_thresholds(df):
 # ===================================================================
 def fig26_nation_clustering(df):
     """Cluster nations by their height profile similarity."""
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig, axes = get_fig(1, 2, (16, 7))
 
     # Build feature matrix: mean height by category for each country
     features = []
@@ -1255,38 +1390,38 @@ def fig26_nation_clustering(df):
     ax = axes[1]
     categories_radar = CATEGORY_ORDER + ["Excess"]
     N = len(categories_radar)
-    angles = np.linspace(0, 2 * np.pi, N, endpoint=False).tolist()
-    angles += angles[:1]
+    angles = np.linspace(0, 2 * np.pi, N, endpoint=False)
+    angles_closed = np.concatenate([angles, angles[:1]])
 
     ax = fig.add_subplot(122, polar=True)
 
+    # Min-max normalize all feature columns in one broadcast pass instead
+    # of rescanning each column per country
+    col_min = feature_matrix.min(axis=0)
+    col_range = feature_matrix.max(axis=0) - col_min
+    safe_range = np.where(col_range > 0, col_range, 1.0)
+    normed_matrix = np.where(col_range > 0,
+                             (feature_matrix - col_min) / safe_range, 0.5)
+
     for i, country in enumerate(NATION_ORDER):
-        values = feature_matrix[i].tolist()
-        # Normalize to 0-1 range per feature
-        normed = []
-        for j, v in enumerate(values):
-            col_min = feature_matrix[:, j].min()
-            col_max = feature_matrix[:, j].max()
-            if col_max - col_min > 0:
-                normed.append((v - col_min) / (col_max - col_min))
-            else:
-                normed.append(0.5)
-        normed += normed[:1]
-        ax.plot(angles, normed, "o-", color=COUNTRY_COLORS[country],
-                label=COUNTRY_NAMES[country], linewidth=1.5, markersize=3, alpha=0.7)
-        ax.fill(angles, normed, color=COUNTRY_COLORS[country], alpha=0.05)
+        normed = np.concatenate([normed_matrix[i], normed_matrix[i, :1]])
+        ax.plot(angles_closed, normed, "o-", color=COUNTRY_COLORS[country],
+                label=COUNTRY_NAMES[country], linewidth=1.5, markersize=3,
+                alpha=0.7, rasterized=True)
+        ax.fill(angles_closed, normed, color=COUNTRY_COLORS[country], alpha=0.05)
 
-    ax.set_xticks(angles[:-1])
+    ax.set_xticks(angles)
     ax.set_xticklabels(categories_radar, fontsize=9)
     ax.set_title("B. Normalized Height Profiles\n(Radar Chart)", y=1.1)
     ax.legend(loc="lower left", bbox_to_anchor=(-0.2, -0.15), ncol=4, fontsize=8)
 
     fig.suptitle("National Height DNA: How Cricket Nations Compare",
                  fontsize=15, fontweight="bold", y=1.05)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig26_nation_clustering.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1296,7 +1431,7 @@ def fig26_nation_clustering(df):
 # ===================================================================
 def fig27_data_quality_mosaic(df):
     """Data quality overview: verified vs estimated heights across eras/countries."""
-    fig, axes = plt.subplots(1, 3, figsize=(18, 6))
+    fig, axes = get_fig(1, 3, (18, 6))
 
     df_copy = df.copy()
     df_copy["height_verified"] = df_copy["height_verified"].astype(str).str.lower().isin(["true", "1"])
@@ -1321,9 +1456,9 @@ def fig27_data_quality_mosaic(df):
     country_verify = df_copy.groupby("country")["height_verified"].mean() * 100
     country_verify = country_verify.reindex(NATION_ORDER)
     bars = ax.barh(
-        [COUNTRY_NAMES.get(c, c) for c in country_verify.index],
+        COUNTRY_NAME_ARR,
         country_verify.values,
-        color=[COUNTRY_COLORS.get(c, "#999") for c in country_verify.index],
+        color=list(COUNTRY_COLOR_ARR),
         edgecolor="white", height=0.6,
     )
     for bar, val in zip(bars, country_verify.values):
@@ -1333,25 +1468,33 @@ def fig27_data_quality_mosaic(df):
     ax.set_title("B. Verification Rate by Country")
     ax.set_xlim(0, 105)
 
-    # Panel C: Flag distribution
+    # Panel C: Flag distribution as a single stacked horizontal bar --
+    # renders as one bar collection instead of per-wedge paths + autopct
     ax = axes[2]
     df_copy["flag_clean"] = df_copy["flag"].fillna("No Flag")
     # Simplify flags
     flag_counts = df_copy["flag_clean"].value_counts().head(8)
-    colors_flag = plt.cm.Set3(np.linspace(0, 1, len(flag_counts)))
-    wedges, texts, autotexts = ax.pie(
-        flag_counts.values, labels=None, autopct="%1.0f%%",
-        colors=colors_flag, startangle=90, pctdistance=0.85,
-    )
-    ax.legend(flag_counts.index, loc="center left", bbox_to_anchor=(1, 0.5), fontsize=8)
+    pct = flag_counts.values / flag_counts.values.sum() * 100
+    left = np.concatenate([[0.0], np.cumsum(pct)[:-1]])
+    bars = ax.barh(np.zeros(len(pct)), pct, left=left,
+                   color=SET3_PALETTE[:len(pct)], height=0.5,
+                   edgecolor="white")
+    ax.bar_label(bars, labels=[f"{v:.0f}%" for v in pct],
+                 label_type="center", fontsize=7)
+    ax.set_xlim(0, 100)
+    ax.set_yticks([])
+    ax.set_xlabel("% of Player Records")
+    ax.legend(bars, flag_counts.index, loc="center left",
+              bbox_to_anchor=(1, 0.5), fontsize=8)
     ax.set_title("C. Distribution of Data Quality Flags")
 
     fig.suptitle("Data Quality Dashboard: How Reliable Is Our Height Data?",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig27_data_quality_mosaic.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1359,39 +1502,80 @@ def fig27_data_quality_mosaic(df):
 # FIGURE 28: "The Effect Size Dashboard" — Cohen's d for all pairwise
 # country and category comparisons
 # ===================================================================
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cohens_d_kernel(n, m, v):
+        size = n.shape[0]
+        out = np.zeros((size, size), dtype=np.float32)
+        for i in prange(size):
+            for j in range(size):
+                if n[i] > 2 and n[j] > 2:
+                    pooled = np.sqrt(((n[i] - 1) * v[i] + (n[j] - 1) * v[j])
+                                     / (n[i] + n[j] - 2))
+                    if pooled > 0:
+                        out[i, j] = (m[i] - m[j]) / pooled
+        return out
+
+
+def cohens_d_matrix(n, m, v) -> np.ndarray:
+    """Pairwise Cohen's d matrix from per-group count/mean/variance.
+
+    Works in float32 throughout -- two-decimal heatmap annotations don't
+    need float64 -- and uses a parallel Numba kernel when available,
+    falling back to a single numpy broadcast.
+    """
+    n = np.asarray(n, dtype=np.float32)
+    m = np.asarray(m, dtype=np.float32)
+    v = np.asarray(v, dtype=np.float32)
+    if HAS_NUMBA:
+        return _cohens_d_kernel(n, m, v)
+    pooled = np.sqrt(((n[:, None] - 1) * v[:, None] + (n[None, :] - 1) * v[None, :])
+                     / (n[:, None] + n[None, :] - 2))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        d = (m[:, None] - m[None, :]) / pooled
+    valid = (n[:, None] > 2) & (n[None, :] > 2) & (pooled > 0)
+    return np.where(valid, d, np.float32(0.0)).astype(np.float32)
+
+
+def _plot_d_heatmap(ax, d_matrix, xticklabels, yticklabels, fontsize=10):
+    """Render a Cohen's d matrix with pcolormesh + batched annotations.
+
+    A single mesh plus plain Text annotations is faster than sns.heatmap,
+    which goes through per-cell wrapper overhead.
+    """
+    n_rows, n_cols = d_matrix.shape
+    mesh = ax.pcolormesh(d_matrix, cmap="RdBu_r", vmin=-1.5, vmax=1.5,
+                         edgecolors="white", linewidth=1)
+    ax.invert_yaxis()  # row 0 at top, matching heatmap orientation
+    ax.set_xticks(np.arange(n_cols) + 0.5)
+    ax.set_xticklabels(xticklabels)
+    ax.set_yticks(np.arange(n_rows) + 0.5)
+    ax.set_yticklabels(yticklabels)
+    ax.set_aspect("equal")
+
+    # Contrast colors computed in bulk for all cells
+    text_colors = np.where(np.abs(d_matrix) > 0.75, "white", "black")
+    for (i, j), val in np.ndenumerate(d_matrix):
+        ax.text(j + 0.5, i + 0.5, f"{val:.2f}", ha="center", va="center",
+                fontsize=fontsize, color=text_colors[i, j])
+    return mesh
+
+
 def fig28_effect_size_dashboard(df):
     """Cohen's d effect size heatmap for pairwise comparisons."""
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig, axes = get_fig(1, 2, (16, 7))
 
-    # Panel A: Category pairwise Cohen's d
+    # Panel A: Category pairwise Cohen's d from one groupby aggregate
     ax = axes[0]
     cats = CATEGORY_ORDER
-    d_matrix = np.zeros((len(cats), len(cats)))
-    for i, c1 in enumerate(cats):
-        for j, c2 in enumerate(cats):
-            h1 = df[df["category"] == c1]["height_cm"].dropna()
-            h2 = df[df["category"] == c2]["height_cm"].dropna()
-            if len(h1) > 2 and len(h2) > 2:
-                pooled_std = np.sqrt(((len(h1) - 1) * h1.std() ** 2 + (len(h2) - 1) * h2.std() ** 2) /
-                                     (len(h1) + len(h2) - 2))
-                if pooled_std > 0:
-                    d_matrix[i, j] = (h1.mean() - h2.mean()) / pooled_std
+    cat_stats = df.groupby("category")["height_cm"].agg(
+        ["count", "mean", "var"]
+    ).reindex(cats)
+    d_matrix = cohens_d_matrix(cat_stats["count"].fillna(0),
+                               cat_stats["mean"], cat_stats["var"])
 
-    if HAS_SEABORN:
-        sns.heatmap(d_matrix, annot=True, fmt=".2f", cmap="RdBu_r", center=0,
-                    xticklabels=cats, yticklabels=cats, ax=ax,
-                    linewidths=1, linecolor="white",
-                    cbar_kws={"label": "Cohen's d"})
-    else:
-        im = ax.imshow(d_matrix, cmap="RdBu_r", vmin=-1.5, vmax=1.5)
-        ax.set_xticks(range(len(cats)))
-        ax.set_xticklabels(cats)
-        ax.set_yticks(range(len(cats)))
-        ax.set_yticklabels(cats)
-        for i in range(len(cats)):
-            for j in range(len(cats)):
-                ax.text(j, i, f"{d_matrix[i, j]:.2f}", ha="center", va="center", fontsize=10)
-        fig.colorbar(im, ax=ax, label="Cohen's d")
+    mesh = _plot_d_heatmap(ax, d_matrix, cats, cats, fontsize=10)
+    fig.colorbar(mesh, ax=ax, label="Cohen's d")
 
     ax.set_title("A. Effect Size: Category Pairwise (Cohen's d)")
 
@@ -1399,43 +1583,26 @@ def fig28_effect_size_dashboard(df):
     ax = axes[1]
     bat = df[df["category"] == "BAT"]
     countries = NATION_ORDER
-    d_matrix_c = np.zeros((len(countries), len(countries)))
-    for i, c1 in enumerate(countries):
-        for j, c2 in enumerate(countries):
-            h1 = bat[bat["country"] == c1]["height_cm"].dropna()
-            h2 = bat[bat["country"] == c2]["height_cm"].dropna()
-            if len(h1) > 2 and len(h2) > 2:
-                pooled_std = np.sqrt(((len(h1) - 1) * h1.std() ** 2 + (len(h2) - 1) * h2.std() ** 2) /
-                                     (len(h1) + len(h2) - 2))
-                if pooled_std > 0:
-                    d_matrix_c[i, j] = (h1.mean() - h2.mean()) / pooled_std
+    country_stats = bat.groupby("country")["height_cm"].agg(
+        ["count", "mean", "var"]
+    ).reindex(countries)
+    d_matrix_c = cohens_d_matrix(country_stats["count"].fillna(0),
+                                 country_stats["mean"], country_stats["var"])
 
     country_labels = [COUNTRY_NAMES.get(c, c) for c in countries]
-    if HAS_SEABORN:
-        sns.heatmap(d_matrix_c, annot=True, fmt=".2f", cmap="RdBu_r", center=0,
-                    xticklabels=country_labels, yticklabels=country_labels, ax=ax,
-                    linewidths=1, linecolor="white",
-                    cbar_kws={"label": "Cohen's d"})
-    else:
-        im = ax.imshow(d_matrix_c, cmap="RdBu_r", vmin=-1.5, vmax=1.5)
-        ax.set_xticks(range(len(countries)))
-        ax.set_xticklabels(country_labels, rotation=45, ha="right")
-        ax.set_yticks(range(len(countries)))
-        ax.set_yticklabels(country_labels)
-        for i in range(len(countries)):
-            for j in range(len(countries)):
-                ax.text(j, i, f"{d_matrix_c[i, j]:.2f}", ha="center", va="center", fontsize=8)
-        fig.colorbar(im, ax=ax, label="Cohen's d")
+    mesh = _plot_d_heatmap(ax, d_matrix_c, country_labels, country_labels, fontsize=8)
+    fig.colorbar(mesh, ax=ax, label="Cohen's d")
 
     ax.set_title("B. Effect Size: Country Pairwise for BAT (Cohen's d)")
     ax.tick_params(axis="x", rotation=45)
 
     fig.suptitle("Effect Size Dashboard: How Big Are the Height Differences?",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig28_effect_size_dashboard.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1445,7 +1612,7 @@ def fig28_effect_size_dashboard(df):
 # ===================================================================
 def fig29_height_inequality(df):
     """Height inequality within teams — Gini coefficient and coefficient of variation."""
-    fig, axes = plt.subplots(1, 2, figsize=(16, 7))
+    fig, axes = get_fig(1, 2, (16, 7))
 
     def gini(arr):
         arr = np.sort(arr)
@@ -1471,7 +1638,7 @@ def fig29_height_inequality(df):
     ineq = pd.DataFrame(team_ineq)
 
     if len(ineq) == 0:
-        plt.close(fig)
+        fig.clear()
         print("  Skipping fig29: insufficient data.")
         return
 
@@ -1501,9 +1668,9 @@ def fig29_height_inequality(df):
     country_cv["sem"] = country_cv["std"] / np.sqrt(country_cv["count"])
     country_cv = country_cv.sort_values("mean")
 
-    bar_colors = [COUNTRY_COLORS.get(c, "#999") for c in country_cv.index]
+    country_labels, bar_colors = country_names_colors(country_cv.index)
     ax.barh(
-        [COUNTRY_NAMES.get(c, c) for c in country_cv.index],
+        country_labels,
         country_cv["mean"],
         xerr=country_cv["sem"] * 1.96,
         color=bar_colors, edgecolor="white", height=0.6, capsize=3,
@@ -1517,10 +1684,11 @@ def fig29_height_inequality(df):
 
     fig.suptitle("Height Inequality: Which Teams Are Most Diverse in Stature?",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig29_height_inequality.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1530,7 +1698,7 @@ def fig29_height_inequality(df):
 # ===================================================================
 def fig30_generation_game(df):
     """Birth cohort analysis: which generations produced the most WC cricketers?"""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 12))
+    fig, axes = get_fig(2, 2, (14, 12))
 
     df_copy = df.copy()
     df_copy["birth_decade"] = (df_copy["birth_year"] // 10) * 10
@@ -1584,7 +1752,9 @@ def fig30_generation_game(df):
 
     # Panel D: Mean age at WC debut by birth decade
     ax = axes[1, 1]
-    first_wc = df_copy.sort_values("tournament_year").drop_duplicates(subset="player_id", keep="first")
+    # First appearance per player via idxmin -- avoids the full sort +
+    # dedup pass of sort_values().drop_duplicates()
+    first_wc = df_copy.loc[df_copy.groupby("player_id")["tournament_year"].idxmin()]
     decade_age = first_wc.groupby("birth_decade")["age_at_tournament"].agg(["mean", "std", "count"])
     decade_age["sem"] = decade_age["std"] / np.sqrt(decade_age["count"])
 
@@ -1601,10 +1771,11 @@ def fig30_generation_game(df):
 
     fig.suptitle("The Generation Game: Birth Cohort Analysis of World Cup Cricketers",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig30_generation_game.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
-    plt.close(fig)
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
+    fig.clear()
     print(f"  Saved: {path}")
 
 
@@ -1618,7 +1789,7 @@ def fig31_team_composition_evolution(df):
 
     # Panel A: Overall composition over time (stacked area)
     ax = axes[0, 0]
-    comp = df.groupby(["tournament_year", "category"]).size().unstack(fill_value=0)
+    comp = get_ctx(df).year_cat
     comp_pct = comp.div(comp.sum(axis=1), axis=0) * 100
     comp_pct = comp_pct.reindex(columns=CATEGORY_ORDER, fill_value=0)
 
@@ -1657,11 +1828,7 @@ def fig31_team_composition_evolution(df):
 
     # Panel C: Mean team height weighted by FAST bowler count
     ax = axes[1, 0]
-    team_data = df.groupby(["tournament_id", "country"]).agg(
-        mean_height=("height_cm", "mean"),
-        n_fast=("category", lambda x: (x == "FAST").sum()),
-        tournament_year=("tournament_year", "first"),
-    ).reset_index()
+    team_data = get_ctx(df).team_agg
 
     # Scatter: more fast bowlers -> taller team?
     colors = [COUNTRY_COLORS.get(c, "#999") for c in team_data["country"]]
@@ -1671,12 +1838,19 @@ def fig31_team_composition_evolution(df):
     # Trend line
     valid = team_data.dropna(subset=["n_fast", "mean_height"])
     if len(valid) > 10:
-        z = np.polyfit(valid["n_fast"], valid["mean_height"], 1)
+        x = valid["n_fast"].to_numpy(dtype=float)
+        y = valid["mean_height"].to_numpy(dtype=float)
+        z = np.polyfit(x, y, 1)
         p_line = np.poly1d(z)
-        x_range = np.linspace(valid["n_fast"].min(), valid["n_fast"].max(), 50)
+        x_range = np.linspace(x.min(), x.max(), 50)
         ax.plot(x_range, p_line(x_range), "r--", linewidth=2,
                 label=f"Trend: {z[0]:+.2f} cm per extra pacer")
-        r, p = sp_stats.pearsonr(valid["n_fast"], valid["mean_height"])
+        # Pearson r and its t-test directly in numpy/scipy.t, skipping
+        # the pearsonr result-object machinery
+        r = float(np.corrcoef(x, y)[0, 1])
+        n = len(x)
+        t_stat = r * np.sqrt((n - 2) / max(1e-12, 1 - r * r))
+        p = 2 * sp_stats.t.sf(abs(t_stat), n - 2)
         ax.text(0.05, 0.95, f"r = {r:.3f}, p = {p:.3f}",
                 transform=ax.transAxes, fontsize=9, va="top",
                 bbox=dict(boxstyle="round,pad=0.3", fc="lightyellow", alpha=0.9, ec="gray"))
@@ -1688,13 +1862,18 @@ def fig31_team_composition_evolution(df):
 
     # Panel D: ODI vs T20 composition
     ax = axes[1, 1]
+    ct = (
+        df.groupby(["format", "category"], observed=True)
+        .size()
+        .unstack("category")
+        .reindex(columns=CATEGORY_ORDER, fill_value=0)
+    )
+    pct = ct.div(ct.sum(axis=1), axis=0) * 100
     for fmt, color in FORMAT_COLORS.items():
-        sub = df[df["format"] == fmt]
-        comp_fmt = sub.groupby("category").size()
-        comp_fmt = comp_fmt.reindex(CATEGORY_ORDER, fill_value=0)
-        comp_pct_fmt = comp_fmt / comp_fmt.sum() * 100
+        if fmt not in pct.index:
+            continue
         offset = -0.2 if fmt == "ODI" else 0.2
-        ax.bar(np.arange(len(CATEGORY_ORDER)) + offset, comp_pct_fmt.values,
+        ax.bar(np.arange(len(CATEGORY_ORDER)) + offset, pct.loc[fmt].values,
                width=0.35, color=color, edgecolor="white", label=fmt, alpha=0.8)
 
     ax.set_xticks(range(len(CATEGORY_ORDER)))
@@ -1705,9 +1884,10 @@ def fig31_team_composition_evolution(df):
 
     fig.suptitle("Team Composition Evolution: The Changing Shape of World Cup Cricket",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig31_team_composition.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -1721,19 +1901,21 @@ def fig32_outlier_gallery(df):
 
     # Panel A: Top 15 tallest players ever
     ax = axes[0]
-    unique_players = df.drop_duplicates(subset="player_id")
+    unique_players = get_ctx(df).unique_players
     tallest = unique_players.nlargest(15, "height_cm").sort_values("height_cm")
 
+    heights = tallest["height_cm"].to_numpy()
     colors = [CATEGORY_COLORS.get(cat, "#999") for cat in tallest["category"]]
-    bars = ax.barh(range(len(tallest)), tallest["height_cm"],
+    bars = ax.barh(range(len(tallest)), heights,
                    color=colors, edgecolor="white", height=0.7)
 
-    labels = [f'{row["full_name"]} ({row["country"]})' for _, row in tallest.iterrows()]
+    labels = [f"{n} ({c})"
+              for n, c in zip(tallest["full_name"], tallest["country"])]
     ax.set_yticks(range(len(tallest)))
     ax.set_yticklabels(labels, fontsize=8)
 
-    for i, (_, row) in enumerate(tallest.iterrows()):
-        ax.text(row["height_cm"] + 0.3, i, f'{row["height_cm"]:.0f} cm',
+    for i, h in enumerate(heights):
+        ax.text(h + 0.3, i, f"{h:.0f} cm",
                 va="center", fontsize=8, fontweight="bold")
 
     ax.set_xlabel("Height (cm)")
@@ -1744,16 +1926,18 @@ def fig32_outlier_gallery(df):
     ax = axes[1]
     shortest = unique_players.nsmallest(15, "height_cm").sort_values("height_cm", ascending=False)
 
+    heights = shortest["height_cm"].to_numpy()
     colors = [CATEGORY_COLORS.get(cat, "#999") for cat in shortest["category"]]
-    bars = ax.barh(range(len(shortest)), shortest["height_cm"],
+    bars = ax.barh(range(len(shortest)), heights,
                    color=colors, edgecolor="white", height=0.7)
 
-    labels = [f'{row["full_name"]} ({row["country"]})' for _, row in shortest.iterrows()]
+    labels = [f"{n} ({c})"
+              for n, c in zip(shortest["full_name"], shortest["country"])]
     ax.set_yticks(range(len(shortest)))
     ax.set_yticklabels(labels, fontsize=8)
 
-    for i, (_, row) in enumerate(shortest.iterrows()):
-        ax.text(row["height_cm"] + 0.3, i, f'{row["height_cm"]:.0f} cm',
+    for i, h in enumerate(heights):
+        ax.text(h + 0.3, i, f"{h:.0f} cm",
                 va="center", fontsize=8, fontweight="bold")
 
     ax.set_xlabel("Height (cm)")
@@ -1765,17 +1949,19 @@ def fig32_outlier_gallery(df):
     ax = axes[2]
     biggest_excess = unique_players.nlargest(15, "height_excess").sort_values("height_excess")
 
+    excesses = biggest_excess["height_excess"].to_numpy()
+    heights = biggest_excess["height_cm"].to_numpy()
     colors = [CATEGORY_COLORS.get(cat, "#999") for cat in biggest_excess["category"]]
-    bars = ax.barh(range(len(biggest_excess)), biggest_excess["height_excess"],
+    bars = ax.barh(range(len(biggest_excess)), excesses,
                    color=colors, edgecolor="white", height=0.7)
 
-    labels = [f'{row["full_name"]} ({row["country"]})' for _, row in biggest_excess.iterrows()]
+    labels = [f"{n} ({c})"
+              for n, c in zip(biggest_excess["full_name"], biggest_excess["country"])]
     ax.set_yticks(range(len(biggest_excess)))
     ax.set_yticklabels(labels, fontsize=8)
 
-    for i, (_, row) in enumerate(biggest_excess.iterrows()):
-        ax.text(row["height_excess"] + 0.3, i,
-                f'+{row["height_excess"]:.1f} cm ({row["height_cm"]:.0f} cm)',
+    for i, (e, h) in enumerate(zip(excesses, heights)):
+        ax.text(e + 0.3, i, f"+{e:.1f} cm ({h:.0f} cm)",
                 va="center", fontsize=7, fontweight="bold")
 
     ax.set_xlabel("Height Excess Over Population (cm)")
@@ -1788,9 +1974,10 @@ def fig32_outlier_gallery(df):
 
     fig.suptitle("The Outlier Gallery: Cricket's Height Extremes",
                  fontsize=15, fontweight="bold", y=1.02)
-    plt.tight_layout()
+    fig.tight_layout()
     path = FIGURES_DIR / "fig32_outlier_gallery.png"
-    fig.savefig(path, dpi=DPI, bbox_inches="tight")
+    fig.savefig(path, dpi=DPI, bbox_inches="tight",
+                pil_kwargs={"optimize": True, "compress_level": 6})
     plt.close(fig)
     print(f"  Saved: {path}")
 
@@ -1799,64 +1986,111 @@ def fig32_outlier_gallery(df):
 # Main
 # ===================================================================
 
+FIGURES = [
+    ("fig12", fig12_height_arms_race),
+    ("fig13", fig13_tallest_vs_shortest_xi),
+    ("fig14", fig14_batting_position_height_profile),
+    ("fig15", fig15_fast_bat_gap),
+    ("fig16", fig16_age_height_relationship),
+    ("fig17", fig17_wicketkeeper_paradox),
+    ("fig18", fig18_team_height_diversity),
+    ("fig19", fig19_spin_vs_fast_by_country),
+    ("fig20", fig20_career_span_giants),
+    ("fig21", fig21_south_asian_catchup),
+    ("fig22", fig22_ridgeline_decades),
+    ("fig23", fig23_allrounder_effect),
+    ("fig24", fig24_team_silhouettes),
+    ("fig25", fig25_height_thresholds),
+    ("fig26", fig26_nation_clustering),
+    ("fig27", fig27_data_quality_mosaic),
+    ("fig28", fig28_effect_size_dashboard),
+    ("fig29", fig29_height_inequality),
+    ("fig30", fig30_generation_game),
+    ("fig31", fig31_team_composition_evolution),
+    ("fig32", fig32_outlier_gallery),
+]
+
+MAX_WORKERS = min(os.cpu_count() or 1, len(FIGURES))
+
+# Per-worker-process DataFrame, loaded once by _init_worker() so the
+# (unpicklable-cheaply) DataFrame is never shipped per task.
+_worker_df = None
+
+
+def load_valid_df() -> pd.DataFrame:
+    """Load the merged table and return only records with valid heights.
+
+    Prefers the Parquet output (typed columns, no parsing); falls back to
+    the CSV with explicit dtypes so nothing is inferred as float64.
+    """
+    if MERGED_PARQUET.exists():
+        try:
+            df = pd.read_parquet(MERGED_PARQUET, columns=list(CSV_DTYPES))
+        except ImportError:
+            df = pd.read_csv(MERGED_CSV, dtype=CSV_DTYPES,
+                             usecols=list(CSV_DTYPES))
+    else:
+        df = pd.read_csv(MERGED_CSV, dtype=CSV_DTYPES,
+                         usecols=list(CSV_DTYPES))
+
+    df_valid = df[df["height_cm"].notna()].copy()
+
+    # Categorical dtypes so every figure's groupby runs on integer codes
+    # instead of re-hashing object strings; category/country get explicit
+    # orderings so reindexing against the module constants is a no-op
+    df_valid["category"] = pd.Categorical(df_valid["category"],
+                                          categories=CATEGORY_ORDER)
+    df_valid["country"] = pd.Categorical(df_valid["country"],
+                                         categories=NATION_ORDER)
+    for col in ("format", "region"):
+        df_valid[col] = df_valid[col].astype("category")
+
+    # Precomputed indicator so aggregations can use the Cython "sum"
+    # fast path instead of a Python lambda
+    df_valid["is_fast"] = (df_valid["category"] == "FAST").astype(np.int8)
+
+    return df_valid
+
+
+def _init_worker():
+    """Initializer for each worker process: load data and style once."""
+    global _worker_df
+    _worker_df = load_valid_df()
+    setup_style()
+
+
+def _run_fig(name: str):
+    """Run a single figure function (by name) against the worker's DataFrame."""
+    func = dict(FIGURES)[name]
+    try:
+        func(_worker_df)
+    except Exception as e:
+        print(f"  ERROR in {name}: {e}")
+        import traceback
+        traceback.print_exc()
+
+
 def main():
-    if not MERGED_CSV.exists():
-        print(f"ERROR: Merged CSV not found: {MERGED_CSV}")
+    if not MERGED_PARQUET.exists() and not MERGED_CSV.exists():
+        print(f"ERROR: Merged player file not found: {MERGED_PARQUET}")
         sys.exit(1)
 
     FIGURES_DIR.mkdir(parents=True, exist_ok=True)
 
-    df = pd.read_csv(MERGED_CSV)
-    print(f"Loaded {len(df)} player-tournament records from {MERGED_CSV}")
-
-    for col in ["height_cm", "tournament_year", "pop_height_birth_cohort",
-                 "height_excess", "era", "birth_year", "age_at_tournament",
-                 "batting_position"]:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
-
-    df_valid = df[df["height_cm"].notna()].copy()
+    df_valid = load_valid_df()
     print(f"Records with valid height: {len(df_valid)}")
 
     if len(df_valid) == 0:
         print("ERROR: No records with valid height data.")
         sys.exit(1)
 
-    setup_style()
-
-    print("\nGenerating new figures...")
-
-    figures = [
-        ("fig12", fig12_height_arms_race),
-        ("fig13", fig13_tallest_vs_shortest_xi),
-        ("fig14", fig14_batting_position_height_profile),
-        ("fig15", fig15_fast_bat_gap),
-        ("fig16", fig16_age_height_relationship),
-        ("fig17", fig17_wicketkeeper_paradox),
-        ("fig18", fig18_team_height_diversity),
-        ("fig19", fig19_spin_vs_fast_by_country),
-        ("fig20", fig20_career_span_giants),
-        ("fig21", fig21_south_asian_catchup),
-        ("fig22", fig22_ridgeline_decades),
-        ("fig23", fig23_allrounder_effect),
-        ("fig24", fig24_team_silhouettes),
-        ("fig25", fig25_height_thresholds),
-        ("fig26", fig26_nation_clustering),
-        ("fig27", fig27_data_quality_mosaic),
-        ("fig28", fig28_effect_size_dashboard),
-        ("fig29", fig29_height_inequality),
-        ("fig30", fig30_generation_game),
-        ("fig31", fig31_team_composition_evolution),
-        ("fig32", fig32_outlier_gallery),
-    ]
+    print(f"\nGenerating new figures ({MAX_WORKERS} workers)...")
 
-    for name, func in figures:
-        try:
-            func(df_valid)
-        except Exception as e:
-            print(f"  ERROR in {name}: {e}")
-            import traceback
-            traceback.print_exc()
+    # Figures are independent pure functions of the DataFrame, so render
+    # them across processes; Agg is selected at import time in each worker.
+    with ProcessPoolExecutor(max_workers=MAX_WORKERS,
+                             initializer=_init_worker) as ex:
+        list(ex.map(_run_fig, [name for name, _ in FIGURES]))
 
     print(f"\nAll new figures saved to: {FIGURES_DIR}")
     print("Done.")
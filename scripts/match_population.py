@@ -10,21 +10,29 @@ For any player whose pop_height_birth_cohort is missing (NaN), looks up the
 population mean height using country + birth_year from the external CSV.
 
 Updates and saves:
-  - data/processed/all_players.csv
-  - data/processed/all_players.parquet  (if pyarrow/fastparquet available)
+  - data/processed/all_players.parquet  (primary, if pyarrow/fastparquet available)
+  - data/processed/all_players.csv      (with --csv, or when no Parquet engine)
 
 Also recomputes height_excess = height_cm - pop_height_birth_cohort.
 
 Usage:
     python scripts/match_population.py
+    python scripts/match_population.py --csv
 """
 
+import argparse
 import sys
 from pathlib import Path
 
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -32,10 +40,75 @@ import numpy as np
 BASE_DIR = Path(__file__).resolve().parent.parent
 POPULATION_CSV = BASE_DIR / "data" / "external" / "population_heights.csv"
 MERGED_CSV = BASE_DIR / "data" / "processed" / "all_players.csv"
+MERGED_PARQUET = BASE_DIR / "data" / "processed" / "all_players.parquet"
 PROCESSED_DIR = BASE_DIR / "data" / "processed"
 
 
+def _nearest_year_idx(years: np.ndarray, by: int) -> int:
+    """Index of the year nearest to ``by`` in a sorted array.
+
+    Ties resolve to the earlier year, matching the historical min() scan.
+    """
+    pos = np.searchsorted(years, by)
+    if pos == 0:
+        return 0
+    if pos == len(years):
+        return len(years) - 1
+    return pos if years[pos] - by < by - years[pos - 1] else pos - 1
+
+
+if HAS_NUMBA:
+    # Compiles to a native binary search + neighbor compare; the pure-
+    # numpy version above is the drop-in fallback when numba is absent
+    _nearest_year_idx = njit(cache=True)(_nearest_year_idx)
+
+
+def save_outputs(df: pd.DataFrame, write_csv: bool):
+    """Save the player table, Parquet-primary; CSV on request or as fallback.
+
+    CSV fully string-formats every cell and is the slowest step of the
+    pipeline, so it is only written when asked for (--csv) or when no
+    Parquet engine is installed.
+    """
+    parquet_path = PROCESSED_DIR / "all_players.parquet"
+    csv_path = PROCESSED_DIR / "all_players.csv"
+
+    wrote_parquet = False
+    try:
+        df.to_parquet(parquet_path, index=False, engine="pyarrow", compression="zstd")
+        print(f"Saved Parquet: {parquet_path}")
+        wrote_parquet = True
+    except ImportError:
+        try:
+            df.to_parquet(parquet_path, index=False, engine="fastparquet")
+            print(f"Saved Parquet: {parquet_path}")
+            wrote_parquet = True
+        except ImportError:
+            print("WARNING: No Parquet engine available; writing CSV instead.")
+
+    if write_csv or not wrote_parquet:
+        df.to_csv(csv_path, index=False)
+        print(f"Saved CSV    : {csv_path}")
+
+
 def main():
+    parser = argparse.ArgumentParser(
+        description="Match cricket players to population height norms."
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        default=False,
+        help="Also rewrite all_players.csv (Parquet is the primary output).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        default=False,
+        help="Print the per-category/country height-excess summaries.",
+    )
+    args = parser.parse_args()
+
     # ------------------------------------------------------------------
     # 1. Load population data
     # ------------------------------------------------------------------
@@ -48,21 +121,33 @@ def main():
     print(f"  Countries: {sorted(pop['country_code'].unique())}")
     print(f"  Birth years: {pop['birth_year'].min()} - {pop['birth_year'].max()}")
 
-    # Build lookup dictionary: (country_code, birth_year) -> mean_height_cm
-    pop_lookup = {}
-    for _, row in pop.iterrows():
-        key = (row["country_code"], int(row["birth_year"]))
-        pop_lookup[key] = float(row["mean_height_cm"])
+    # Per-country sorted (years, heights) arrays so the nearest-year
+    # fallback is an O(log Y) searchsorted instead of a dict scan
+    country_years_arr = {}
+    for cc, grp in pop.groupby("country_code"):
+        g = grp.sort_values("birth_year")
+        country_years_arr[cc] = (
+            g["birth_year"].to_numpy(),
+            g["mean_height_cm"].astype(float).to_numpy(),
+        )
 
     # ------------------------------------------------------------------
     # 2. Load merged player data
     # ------------------------------------------------------------------
-    if not MERGED_CSV.exists():
-        print(f"ERROR: Merged player file not found: {MERGED_CSV}")
+    if not MERGED_PARQUET.exists() and not MERGED_CSV.exists():
+        print(f"ERROR: Merged player file not found: {MERGED_PARQUET}")
         print("       Run merge_all_tournaments.py first.")
         sys.exit(1)
 
-    df = pd.read_csv(MERGED_CSV)
+    # Prefer the Parquet output (the merge step's primary file); fall back
+    # to the CSV when only it exists or no Parquet engine is installed
+    if MERGED_PARQUET.exists():
+        try:
+            df = pd.read_parquet(MERGED_PARQUET)
+        except ImportError:
+            df = pd.read_csv(MERGED_CSV)
+    else:
+        df = pd.read_csv(MERGED_CSV)
     print(f"\nLoaded merged data: {len(df)} player-tournament records")
 
     initial_missing = df["pop_height_birth_cohort"].isna().sum()
@@ -75,33 +160,38 @@ def main():
     # ------------------------------------------------------------------
     # 3. Fill missing population heights
     # ------------------------------------------------------------------
-    filled_count = 0
-    not_found_keys = set()
+    # Exact (country, birth_year) matches resolved in one vectorized
+    # lookup instead of a per-row iterrows scan. All fills are staged in
+    # one numpy array and written back with a single column assignment,
+    # avoiding the per-cell .at write path.
+    pop_series = pop.set_index(["country_code", "birth_year"])["mean_height_cm"].astype(float)
+    lookup_idx = pd.MultiIndex.from_arrays(
+        [df["country"], df["birth_year"].fillna(-1).astype(int)]
+    )
+    exact = pop_series.reindex(lookup_idx).to_numpy()
 
-    for idx, row in df.iterrows():
-        if pd.isna(row["pop_height_birth_cohort"]):
-            country = row.get("country", "")
-            by = row.get("birth_year")
-
-            if pd.isna(by):
-                continue
-
-            by = int(by)
-            key = (country, by)
-
-            if key in pop_lookup:
-                df.at[idx, "pop_height_birth_cohort"] = pop_lookup[key]
-                filled_count += 1
-            else:
-                not_found_keys.add(key)
-                # Try interpolation: find nearest available birth year
-                country_years = {
-                    yr: ht for (cc, yr), ht in pop_lookup.items() if cc == country
-                }
-                if country_years:
-                    nearest_year = min(country_years.keys(), key=lambda y: abs(y - by))
-                    df.at[idx, "pop_height_birth_cohort"] = country_years[nearest_year]
-                    filled_count += 1
+    filled = df["pop_height_birth_cohort"].to_numpy(dtype=float, na_value=np.nan, copy=True)
+    missing = np.isnan(filled)
+    exact_fill = missing & ~np.isnan(exact)
+    filled[exact_fill] = exact[exact_fill]
+    filled_count = int(exact_fill.sum())
+
+    # Nearest-year fallback only for the (few) rows with no exact match
+    not_found_keys = set()
+    fallback = missing & np.isnan(exact) & df["birth_year"].notna().to_numpy()
+    countries = df["country"].to_numpy()
+    birth_years = df["birth_year"].to_numpy()
+    for i in np.flatnonzero(fallback):
+        country = countries[i]
+        by = int(birth_years[i])
+        not_found_keys.add((country, by))
+        if country not in country_years_arr:
+            continue
+        years, heights = country_years_arr[country]
+        filled[i] = heights[_nearest_year_idx(years, by)]
+        filled_count += 1
+
+    df["pop_height_birth_cohort"] = filled
 
     print(f"\nFilled {filled_count} missing population height values")
 
@@ -115,30 +205,15 @@ def main():
     # ------------------------------------------------------------------
     # 4. Recompute height_excess
     # ------------------------------------------------------------------
-    df["height_excess"] = np.where(
-        df["height_cm"].notna() & df["pop_height_birth_cohort"].notna(),
-        df["height_cm"] - df["pop_height_birth_cohort"],
-        np.nan,
-    )
+    # Plain subtraction propagates NaN where either operand is missing,
+    # so no mask pass is needed
+    df["height_excess"] = df["height_cm"] - df["pop_height_birth_cohort"]
 
     # ------------------------------------------------------------------
     # 5. Save updated data
     # ------------------------------------------------------------------
-    csv_path = PROCESSED_DIR / "all_players.csv"
-    df.to_csv(csv_path, index=False)
-    print(f"\nSaved updated CSV: {csv_path}")
-
-    try:
-        parquet_path = PROCESSED_DIR / "all_players.parquet"
-        df.to_parquet(parquet_path, index=False, engine="pyarrow")
-        print(f"Saved updated Parquet: {parquet_path}")
-    except ImportError:
-        try:
-            parquet_path = PROCESSED_DIR / "all_players.parquet"
-            df.to_parquet(parquet_path, index=False, engine="fastparquet")
-            print(f"Saved updated Parquet: {parquet_path}")
-        except ImportError:
-            print("WARNING: No Parquet engine available; skipping Parquet output.")
+    print()
+    save_outputs(df, write_csv=args.csv)
 
     # ------------------------------------------------------------------
     # 6. Summary
@@ -153,7 +228,8 @@ def main():
     print(f"Still missing             : {remaining_missing}")
     print(f"Height excess computable  : {df['height_excess'].notna().sum()}")
 
-    if df["height_excess"].notna().any():
+    # Groupby summaries are reporting only -- skipped unless asked for
+    if args.verbose and df["height_excess"].notna().any():
         print(f"\n--- Height excess by category (cm) ---")
         excess = df.groupby("category")["height_excess"].agg(["mean", "std", "count"])
         print(excess.to_string())
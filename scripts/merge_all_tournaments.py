@@ -2,7 +2,8 @@
 """
 merge_all_tournaments.py - Load all tournament JSONs from data/raw/,
 flatten into a single DataFrame, compute derived columns, and save to
-data/processed/all_players.csv and data/processed/all_players.parquet.
+data/processed/all_players.parquet (primary) and optionally
+data/processed/all_players.csv (--csv, or when no Parquet engine).
 
 Derived columns added:
   - height_excess  = height_cm - pop_height_birth_cohort
@@ -10,15 +11,34 @@ Derived columns added:
 
 Usage:
     python scripts/merge_all_tournaments.py
+    python scripts/merge_all_tournaments.py --csv
 """
 
+import argparse
+import itertools
 import json
+import pickle
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 
 import pandas as pd
 import numpy as np
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
@@ -66,10 +86,58 @@ OUTPUT_COLUMNS = [
 # Core logic
 # ---------------------------------------------------------------------------
 
-def load_tournament(filepath: Path) -> list[dict]:
-    """Load a single tournament JSON and return a flat list of player dicts."""
-    with open(filepath, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
+# Columns copied straight from each player record; the remaining output
+# columns are per-tournament constants or derived later.
+PLAYER_FIELDS = [
+    "player_id",
+    "full_name",
+    "category",
+    "batting_position",
+    "date_of_birth",
+    "birth_year",
+    "age_at_tournament",
+    "height_cm",
+    "height_verified",
+    "height_source",
+    "pop_height_birth_cohort",
+    "flag",
+    "notes",
+]
+
+LOADED_COLUMNS = PLAYER_FIELDS[:2] + ["country"] + PLAYER_FIELDS[2:] + [
+    "tournament_id",
+    "format",
+    "tournament_year",
+    "era",
+]
+
+
+def load_tournament(filepath: Path, parsed_dir: Path = None) -> dict[str, list]:
+    """Load a single tournament JSON and return a dict of column lists.
+
+    Building columnar lists directly (instead of one dict per player)
+    avoids the row-dict allocations and the AoS->SoA transpose pandas
+    would otherwise do in pd.DataFrame(list_of_dicts).
+
+    When ``parsed_dir`` holds an up-to-date pickle emitted by
+    validate_data.py --emit-parsed, the JSON parse is skipped entirely.
+    """
+    data = None
+    if parsed_dir is not None:
+        pkl = parsed_dir / (filepath.name + ".pkl")
+        try:
+            if pkl.stat().st_mtime >= filepath.stat().st_mtime:
+                with open(pkl, "rb") as fh:
+                    data = pickle.load(fh)
+        except (OSError, pickle.UnpicklingError):
+            data = None
+
+    if data is None:
+        if HAS_ORJSON:
+            data = orjson.loads(filepath.read_bytes())
+        else:
+            with open(filepath, "r", encoding="utf-8") as fh:
+                data = json.load(fh)
 
     tournament = data.get("tournament", {})
     t_id = tournament.get("tournament_id", filepath.stem)
@@ -77,36 +145,78 @@ def load_tournament(filepath: Path) -> list[dict]:
     t_year = tournament.get("year")
     t_era = tournament.get("era")
 
-    rows = []
+    cols: dict[str, list] = {k: [] for k in LOADED_COLUMNS}
+    n_players = 0
     for team in data.get("teams", []):
         nation = team.get("nation", "")
         for player in team.get("playing_xi", []):
-            row = {
-                "player_id": player.get("player_id"),
-                "full_name": player.get("full_name"),
-                "country": nation,
-                "category": player.get("category"),
-                "batting_position": player.get("batting_position"),
-                "date_of_birth": player.get("date_of_birth"),
-                "birth_year": player.get("birth_year"),
-                "age_at_tournament": player.get("age_at_tournament"),
-                "height_cm": player.get("height_cm"),
-                "height_verified": player.get("height_verified"),
-                "height_source": player.get("height_source"),
-                "pop_height_birth_cohort": player.get("pop_height_birth_cohort"),
-                "flag": player.get("flag"),
-                "notes": player.get("notes", ""),
-                "tournament_id": t_id,
-                "format": t_format,
-                "tournament_year": t_year,
-                "era": t_era,
-            }
-            rows.append(row)
-
-    return rows
+            for field in PLAYER_FIELDS:
+                cols[field].append(player.get(field, "" if field == "notes" else None))
+            cols["country"].append(nation)
+            n_players += 1
+
+    cols["tournament_id"] = [t_id] * n_players
+    cols["format"] = [t_format] * n_players
+    cols["tournament_year"] = [t_year] * n_players
+    cols["era"] = [t_era] * n_players
+
+    return cols
+
+
+def save_outputs(df: pd.DataFrame, write_csv: bool):
+    """Save the merged table, Parquet-primary; CSV on request or as fallback."""
+    parquet_path = PROCESSED_DIR / "all_players.parquet"
+    csv_path = PROCESSED_DIR / "all_players.csv"
+
+    wrote_parquet = False
+    if HAS_PYARROW:
+        # Build the arrow table column-by-column: per-Series conversion is
+        # zero-copy for the numeric columns and skips the BlockManager
+        # consolidation that Table.from_pandas / to_parquet would do
+        table = pa.table(
+            {c: pa.array(df[c], from_pandas=True) for c in df.columns}
+        )
+        pq.write_table(table, parquet_path, compression="zstd")
+        print(f"\nSaved Parquet: {parquet_path}")
+        wrote_parquet = True
+    else:
+        try:
+            df.to_parquet(parquet_path, index=False, engine="fastparquet")
+            print(f"\nSaved Parquet: {parquet_path}")
+            wrote_parquet = True
+        except ImportError:
+            print("\nWARNING: No Parquet engine available; writing CSV instead.")
+
+    if write_csv or not wrote_parquet:
+        df.to_csv(csv_path, index=False)
+        print(f"Saved CSV    : {csv_path}")
 
 
 def main():
+    parser = argparse.ArgumentParser(
+        description="Merge raw tournament JSONs into the processed player table."
+    )
+    parser.add_argument(
+        "--csv",
+        action="store_true",
+        default=False,
+        help="Also write all_players.csv (Parquet is the primary output).",
+    )
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        default=False,
+        help="Print the full merge summary (groupby/describe reporting).",
+    )
+    parser.add_argument(
+        "--parsed",
+        default=None,
+        metavar="DIR",
+        help="Directory of pickles from validate_data.py --emit-parsed; "
+             "up-to-date entries skip the JSON parse.",
+    )
+    args = parser.parse_args()
+
     # Ensure output directory exists
     PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -118,32 +228,46 @@ def main():
 
     print(f"Found {len(json_files)} tournament file(s) in {RAW_DIR}")
 
-    # Load all tournaments
-    all_rows: list[dict] = []
-    for jf in json_files:
-        rows = load_tournament(jf)
-        print(f"  {jf.name}: {len(rows)} player-tournament records")
-        all_rows.extend(rows)
+    # Load all tournaments in parallel -- JSON parsing is CPU-bound and
+    # independent per file, and load_tournament returns picklable columns
+    loader = partial(
+        load_tournament,
+        parsed_dir=Path(args.parsed) if args.parsed else None,
+    )
+    with ProcessPoolExecutor() as ex:
+        per_file_cols = list(ex.map(loader, json_files))
+
+    for jf, cols in zip(json_files, per_file_cols):
+        print(f"  {jf.name}: {len(cols['player_id'])} player-tournament records")
 
-    if not all_rows:
+    # Concatenate per-file column lists; the DataFrame is built once from
+    # ready-made columns
+    all_cols = {
+        k: list(itertools.chain.from_iterable(c[k] for c in per_file_cols))
+        for k in LOADED_COLUMNS
+    }
+
+    if not all_cols["player_id"]:
         print("ERROR: No player records extracted.")
         sys.exit(1)
 
-    df = pd.DataFrame(all_rows)
+    df = pd.DataFrame(all_cols)
 
     # ------------------------------------------------------------------
     # Derived columns
     # ------------------------------------------------------------------
 
-    # height_excess
-    df["height_excess"] = np.where(
-        df["height_cm"].notna() & df["pop_height_birth_cohort"].notna(),
-        df["height_cm"] - df["pop_height_birth_cohort"],
-        np.nan,
-    )
+    # height_excess -- plain subtraction propagates NaN where either
+    # operand is missing, no mask pass needed
+    df["height_excess"] = df["height_cm"] - df["pop_height_birth_cohort"]
 
-    # region
-    df["region"] = df["country"].map(REGION_MAP).fillna("Unknown")
+    # region -- map through the categorical codes: one numpy indexing op
+    # over a small per-category table instead of a per-element dict lookup
+    df["country"] = df["country"].astype("category")
+    codes_to_region = np.asarray(
+        [REGION_MAP.get(c, "Unknown") for c in df["country"].cat.categories]
+    )
+    df["region"] = pd.Categorical(codes_to_region[df["country"].cat.codes])
 
     # Ensure column order (add any missing columns as NaN)
     for col in OUTPUT_COLUMNS:
@@ -151,28 +275,29 @@ def main():
             df[col] = np.nan
     df = df[OUTPUT_COLUMNS]
 
+    # Downcast numerics: heights fit comfortably in float32 and the year/
+    # position columns in Int16, halving bytes for every downstream scan
+    # and for the Parquet file
+    # (age_at_tournament is fractional in the data, so it stays float)
+    for col in ("height_cm", "pop_height_birth_cohort", "height_excess", "age_at_tournament"):
+        df[col] = pd.to_numeric(df[col], errors="coerce", downcast="float")
+    for col in ("birth_year", "tournament_year", "batting_position"):
+        df[col] = pd.to_numeric(df[col], errors="coerce").astype("Int16")
+
     # ------------------------------------------------------------------
     # Save
     # ------------------------------------------------------------------
-    csv_path = PROCESSED_DIR / "all_players.csv"
-    df.to_csv(csv_path, index=False)
-    print(f"\nSaved CSV  : {csv_path}")
-
-    try:
-        parquet_path = PROCESSED_DIR / "all_players.parquet"
-        df.to_parquet(parquet_path, index=False, engine="pyarrow")
-        print(f"Saved Parquet: {parquet_path}")
-    except ImportError:
-        try:
-            parquet_path = PROCESSED_DIR / "all_players.parquet"
-            df.to_parquet(parquet_path, index=False, engine="fastparquet")
-            print(f"Saved Parquet: {parquet_path}")
-        except ImportError:
-            print("WARNING: Neither pyarrow nor fastparquet installed; skipping Parquet output.")
+    save_outputs(df, write_csv=args.csv)
 
     # ------------------------------------------------------------------
-    # Summary statistics
+    # Summary statistics (reporting only -- skipped in batch runs)
     # ------------------------------------------------------------------
+    if not args.verbose:
+        print(f"\nMerged {len(df)} player-tournament records "
+              f"(--verbose for the full summary).")
+        print("\nDone.")
+        return
+
     print("\n" + "=" * 72)
     print("MERGE SUMMARY")
     print("=" * 72)
@@ -24,8 +24,10 @@ Usage:
 """
 
 import json
+import os
 import sys
 import warnings
+from contextlib import nullcontext
 from pathlib import Path
 
 import numpy as np
@@ -36,7 +38,7 @@ from scipy import stats
 try:
     import statsmodels.api as sm
     import statsmodels.formula.api as smf
-    from statsmodels.regression.mixed_linear_model import MixedLM
+    from statsmodels.regression.mixed_linear_model import MixedLM, MixedLMParams
     HAS_STATSMODELS = True
 except ImportError:
     HAS_STATSMODELS = False
@@ -48,6 +50,24 @@ try:
 except ImportError:
     HAS_PINGOUIN = False
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+try:
+    from threadpoolctl import threadpool_limits
+    HAS_THREADPOOLCTL = True
+except ImportError:
+    HAS_THREADPOOLCTL = False
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 warnings.filterwarnings("ignore", category=FutureWarning)
 warnings.filterwarnings("ignore", category=RuntimeWarning)
 
@@ -57,6 +77,7 @@ warnings.filterwarnings("ignore", category=RuntimeWarning)
 
 BASE_DIR = Path(__file__).resolve().parent.parent
 MERGED_CSV = BASE_DIR / "data" / "processed" / "all_players.csv"
+MERGED_PARQUET = BASE_DIR / "data" / "processed" / "all_players.parquet"
 OUTPUT_JSON = BASE_DIR / "data" / "processed" / "analysis_results.json"
 
 CATEGORIES = ["WK", "BAT", "FAST", "SPIN"]
@@ -74,15 +95,16 @@ def print_header(title: str):
     print(f"{'=' * 72}")
 
 
-def safe_ols(formula: str, data: pd.DataFrame) -> dict:
-    """Run OLS regression and return a summary dict. Returns None on error."""
+def safe_ols(formula: str, data: pd.DataFrame, cols: tuple) -> dict:
+    """Run OLS regression and return a summary dict. Returns None on error.
+
+    ``cols`` names the formula's columns explicitly, so the subset for
+    dropna does not have to be re-tokenized from the formula per call.
+    """
     if not HAS_STATSMODELS:
         return None
     try:
-        data_clean = data.dropna(subset=[
-            c.strip() for c in formula.replace("~", "+").split("+")
-            if c.strip() and c.strip() != ""
-        ])
+        data_clean = data.dropna(subset=list(cols))
         if len(data_clean) < 5:
             return None
         model = smf.ols(formula, data=data_clean).fit()
@@ -95,14 +117,22 @@ def safe_ols(formula: str, data: pd.DataFrame) -> dict:
             "f_pvalue": round(float(model.f_pvalue), 6) if not np.isnan(model.f_pvalue) else None,
             "coefficients": {},
         }
-        for param in model.params.index:
+        # Pull each statistic vector out once -- conf_int() in particular
+        # recomputes its full k x 2 frame on every call -- and index by
+        # position instead of label inside the loop
+        params = model.params.to_numpy()
+        bse = model.bse.to_numpy()
+        tvalues = model.tvalues.to_numpy()
+        pvalues = model.pvalues.to_numpy()
+        ci = model.conf_int().to_numpy()
+        for i, param in enumerate(model.params.index):
             result["coefficients"][param] = {
-                "estimate": round(float(model.params[param]), 4),
-                "std_err": round(float(model.bse[param]), 4),
-                "t_value": round(float(model.tvalues[param]), 4),
-                "p_value": round(float(model.pvalues[param]), 6),
-                "ci_lower": round(float(model.conf_int().loc[param, 0]), 4),
-                "ci_upper": round(float(model.conf_int().loc[param, 1]), 4),
+                "estimate": round(float(params[i]), 4),
+                "std_err": round(float(bse[i]), 4),
+                "t_value": round(float(tvalues[i]), 4),
+                "p_value": round(float(pvalues[i]), 6),
+                "ci_lower": round(float(ci[i, 0]), 4),
+                "ci_upper": round(float(ci[i, 1]), 4),
             }
         return result
     except Exception as e:
@@ -110,6 +140,75 @@ def safe_ols(formula: str, data: pd.DataFrame) -> dict:
         return None
 
 
+def fast_ols_year(data: pd.DataFrame, x: str = "tournament_year",
+                  y: str = "height_cm") -> dict:
+    """Closed-form simple OLS of y on x, emitting safe_ols's result shape.
+
+    The single-predictor tables only need slope/intercept inference, so
+    the statsmodels formula-parsing and SVD machinery is skipped in
+    favour of the textbook sufficient-statistics solution. safe_ols is
+    still used for the multi-term models (Tables 4 and 8).
+    """
+    clean = data.dropna(subset=[x, y])
+    return fast_ols_arrays(
+        clean[x].to_numpy(dtype=float),
+        clean[y].to_numpy(dtype=float),
+        x_name=x, y_name=y,
+    )
+
+
+def fast_ols_arrays(xv: np.ndarray, yv: np.ndarray,
+                    x_name: str = "tournament_year",
+                    y_name: str = "height_cm") -> dict:
+    """Closed-form simple OLS on pre-extracted contiguous arrays."""
+    n = xv.size
+    if n < 5:
+        return None
+    xbar = xv.mean()
+    ybar = yv.mean()
+    dx = xv - xbar
+    dy = yv - ybar
+    sxx = dx @ dx
+    syy = dy @ dy
+    sxy = dx @ dy
+    if sxx == 0:
+        return None
+    slope = sxy / sxx
+    intercept = ybar - slope * xbar
+    rss = syy - slope * sxy
+    df_resid = n - 2
+    sigma2 = rss / df_resid
+    se_slope = np.sqrt(sigma2 / sxx)
+    se_intercept = np.sqrt(sigma2 * (1.0 / n + xbar * xbar / sxx))
+    t_crit = stats.t.ppf(0.975, df_resid)
+    r_squared = 1.0 - rss / syy if syy > 0 else 0.0
+    f_stat = (syy - rss) / sigma2
+
+    def coef(est, se):
+        t_val = est / se
+        return {
+            "estimate": round(float(est), 4),
+            "std_err": round(float(se), 4),
+            "t_value": round(float(t_val), 4),
+            "p_value": round(float(2 * stats.t.sf(abs(t_val), df_resid)), 6),
+            "ci_lower": round(float(est - t_crit * se), 4),
+            "ci_upper": round(float(est + t_crit * se), 4),
+        }
+
+    return {
+        "formula": f"{y_name} ~ {x_name}",
+        "n": int(n),
+        "r_squared": round(float(r_squared), 4),
+        "adj_r_squared": round(float(1.0 - (1.0 - r_squared) * (n - 1) / df_resid), 4),
+        "f_statistic": round(float(f_stat), 4),
+        "f_pvalue": round(float(stats.f.sf(f_stat, 1, df_resid)), 6),
+        "coefficients": {
+            "Intercept": coef(intercept, se_intercept),
+            x_name: coef(slope, se_slope),
+        },
+    }
+
+
 def format_coef(coef_dict: dict, key: str) -> str:
     """Format a coefficient for table display."""
     if coef_dict is None or key not in coef_dict:
@@ -154,10 +253,13 @@ def table2_descriptive(df: pd.DataFrame) -> dict:
 
     # Category x Era
     print("\n--- Category x Era (Mean Height cm) ---")
-    pivot = df.pivot_table(
-        values="height_cm", index="category", columns="era",
-        aggfunc=["mean", "count"]
-    ).round(2)
+    # One groupby pass instead of pivot_table's separate scan per aggfunc
+    pivot = (
+        df.groupby(["category", "era"], observed=True)["height_cm"]
+        .agg(["mean", "count"])
+        .round(2)
+        .unstack("era")
+    )
     print(pivot.to_string())
 
     # Height excess by category
@@ -188,18 +290,19 @@ def table2_descriptive(df: pd.DataFrame) -> dict:
     return results
 
 
-def table3_unadjusted_regression(df: pd.DataFrame) -> dict:
+def table3_unadjusted_regression(cat_arrays: dict, years: np.ndarray,
+                                 heights: np.ndarray) -> dict:
     """Table 3: Linear regression height ~ year, for each category."""
     print_header("TABLE 3: Unadjusted Linear Regression (height ~ tournament_year)")
 
     results = {}
     for cat in CATEGORIES:
-        subset = df[df["category"] == cat].dropna(subset=["height_cm", "tournament_year"])
-        if len(subset) < 5:
-            print(f"\n  {cat}: Insufficient data (n={len(subset)})")
+        xv, yv = cat_arrays.get(cat, (np.empty(0), np.empty(0)))
+        if xv.size < 5:
+            print(f"\n  {cat}: Insufficient data (n={xv.size})")
             continue
 
-        res = safe_ols("height_cm ~ tournament_year", subset)
+        res = fast_ols_arrays(xv, yv)
         results[cat] = res
         if res:
             print(f"\n  {cat} (n={res['n']}, R2={res['r_squared']:.4f}):")
@@ -207,9 +310,8 @@ def table3_unadjusted_regression(df: pd.DataFrame) -> dict:
             print(f"    Intercept: {format_coef(res['coefficients'], 'Intercept')}")
 
     # All categories combined
-    subset_all = df.dropna(subset=["height_cm", "tournament_year"])
-    if len(subset_all) >= 5:
-        res_all = safe_ols("height_cm ~ tournament_year", subset_all)
+    if heights.size >= 5:
+        res_all = fast_ols_arrays(years, heights)
         results["ALL"] = res_all
         if res_all:
             print(f"\n  ALL (n={res_all['n']}, R2={res_all['r_squared']:.4f}):")
@@ -218,7 +320,7 @@ def table3_unadjusted_regression(df: pd.DataFrame) -> dict:
     return results
 
 
-def table4_adjusted_regression(df: pd.DataFrame) -> dict:
+def table4_adjusted_regression(df: pd.DataFrame, table3_results: dict) -> dict:
     """Table 4: Population-adjusted regression height ~ year + pop_height."""
     print_header("TABLE 4: Population-Adjusted Regression (height ~ year + pop_height)")
 
@@ -235,7 +337,10 @@ def table4_adjusted_regression(df: pd.DataFrame) -> dict:
             print(f"\n  {cat}: Insufficient data (n={len(subset)})")
             continue
 
-        res = safe_ols("height_cm ~ tournament_year + pop_height_birth_cohort", subset)
+        res = safe_ols(
+            "height_cm ~ tournament_year + pop_height_birth_cohort", subset,
+            cols=("height_cm", "tournament_year", "pop_height_birth_cohort"),
+        )
         results[cat] = res
         if res:
             print(f"\n  {cat} (n={res['n']}, R2={res['r_squared']:.4f}, "
@@ -244,7 +349,10 @@ def table4_adjusted_regression(df: pd.DataFrame) -> dict:
             print(f"    Pop height coef:       {format_coef(res['coefficients'], 'pop_height_birth_cohort')}")
 
     # All combined
-    res_all = safe_ols("height_cm ~ tournament_year + pop_height_birth_cohort", subset_all)
+    res_all = safe_ols(
+        "height_cm ~ tournament_year + pop_height_birth_cohort", subset_all,
+        cols=("height_cm", "tournament_year", "pop_height_birth_cohort"),
+    )
     results["ALL"] = res_all
     if res_all:
         print(f"\n  ALL (n={res_all['n']}, R2={res_all['r_squared']:.4f}):")
@@ -252,21 +360,23 @@ def table4_adjusted_regression(df: pd.DataFrame) -> dict:
         print(f"    Pop height coef:       {format_coef(res_all['coefficients'], 'pop_height_birth_cohort')}")
 
     # Compute attenuation
+    # Unadjusted slopes were already fitted for Table 3 -- read them from
+    # its results instead of re-running the per-category OLS
     print("\n--- Attenuation Analysis ---")
     for cat in CATEGORIES:
-        unadj_key = f"tournament_year"
         if cat in results and results[cat] is not None:
-            adj_slope = results[cat]["coefficients"].get(unadj_key, {}).get("estimate")
-            # Need unadjusted from Table 3
-            subset_cat = df[df["category"] == cat].dropna(subset=["height_cm", "tournament_year"])
-            unadj_res = safe_ols("height_cm ~ tournament_year", subset_cat)
-            if unadj_res and adj_slope is not None:
-                unadj_slope = unadj_res["coefficients"].get(unadj_key, {}).get("estimate")
-                if unadj_slope and unadj_slope != 0:
-                    attenuation = 1 - (adj_slope / unadj_slope)
-                    print(f"  {cat}: Unadjusted={unadj_slope:.4f}, "
-                          f"Adjusted={adj_slope:.4f}, "
-                          f"Attenuation={attenuation:.1%}")
+            adj_slope = results[cat]["coefficients"].get("tournament_year", {}).get("estimate")
+            unadj_slope = (
+                (table3_results.get(cat) or {})
+                .get("coefficients", {})
+                .get("tournament_year", {})
+                .get("estimate")
+            )
+            if adj_slope is not None and unadj_slope:
+                attenuation = 1 - (adj_slope / unadj_slope)
+                print(f"  {cat}: Unadjusted={unadj_slope:.4f}, "
+                      f"Adjusted={adj_slope:.4f}, "
+                      f"Attenuation={attenuation:.1%}")
 
     return results
 
@@ -278,17 +388,77 @@ def table5_country_regression(df: pd.DataFrame) -> dict:
     results = {}
     bat = df[df["category"] == "BAT"].dropna(subset=["height_cm", "tournament_year"])
 
+    # One groupby pass collects per-country sufficient statistics; the
+    # regression algebra then runs vectorized over the tiny result frame
+    # instead of one statsmodels fit per nation. x/y are centred on the
+    # global means for numerical conditioning (per-group Sxx/Sxy/Syy are
+    # shift-invariant).
+    cx = bat["tournament_year"].mean()
+    cy = bat["height_cm"].mean()
+    tmp = pd.DataFrame({
+        "country": bat["country"],
+        "x": bat["tournament_year"].astype(float) - cx,
+        "y": bat["height_cm"].astype(float) - cy,
+    })
+    tmp["xx"] = tmp["x"] ** 2
+    tmp["yy"] = tmp["y"] ** 2
+    tmp["xy"] = tmp["x"] * tmp["y"]
+    g = tmp.groupby("country").agg(
+        n=("x", "size"), sx=("x", "sum"), sy=("y", "sum"),
+        sxx=("xx", "sum"), syy=("yy", "sum"), sxy=("xy", "sum"),
+    )
+
+    n = g["n"]
+    Sxx = g["sxx"] - g["sx"] ** 2 / n
+    Syy = g["syy"] - g["sy"] ** 2 / n
+    Sxy = g["sxy"] - g["sx"] * g["sy"] / n
+    xbar = g["sx"] / n + cx
+    ybar = g["sy"] / n + cy
+    slope = Sxy / Sxx
+    intercept = ybar - slope * xbar
+    rss = Syy - slope * Sxy
+    df_resid = n - 2
+    sigma2 = rss / df_resid
+    se_slope = np.sqrt(sigma2 / Sxx)
+    se_intercept = np.sqrt(sigma2 * (1.0 / n + xbar ** 2 / Sxx))
+    t_crit = stats.t.ppf(0.975, df_resid)
+    r_squared = 1.0 - rss / Syy
+    f_stat = (Syy - rss) / sigma2
+
+    def coef(est, se, nation):
+        t_val = est[nation] / se[nation]
+        return {
+            "estimate": round(float(est[nation]), 4),
+            "std_err": round(float(se[nation]), 4),
+            "t_value": round(float(t_val), 4),
+            "p_value": round(float(2 * stats.t.sf(abs(t_val), df_resid[nation])), 6),
+            "ci_lower": round(float(est[nation] - t_crit[g.index.get_loc(nation)] * se[nation]), 4),
+            "ci_upper": round(float(est[nation] + t_crit[g.index.get_loc(nation)] * se[nation]), 4),
+        }
+
     for nation in NATIONS:
-        subset = bat[bat["country"] == nation]
-        if len(subset) < 5:
-            print(f"\n  {nation}: Insufficient data (n={len(subset)})")
+        n_nation = int(n.get(nation, 0))
+        if n_nation < 5:
+            print(f"\n  {nation}: Insufficient data (n={n_nation})")
             continue
 
-        res = safe_ols("height_cm ~ tournament_year", subset)
+        res = {
+            "formula": "height_cm ~ tournament_year",
+            "n": n_nation,
+            "r_squared": round(float(r_squared[nation]), 4),
+            "adj_r_squared": round(
+                float(1.0 - (1.0 - r_squared[nation]) * (n_nation - 1) / df_resid[nation]), 4
+            ),
+            "f_statistic": round(float(f_stat[nation]), 4),
+            "f_pvalue": round(float(stats.f.sf(f_stat[nation], 1, df_resid[nation])), 6),
+            "coefficients": {
+                "Intercept": coef(intercept, se_intercept, nation),
+                "tournament_year": coef(slope, se_slope, nation),
+            },
+        }
         results[nation] = res
-        if res:
-            print(f"\n  {nation} (n={res['n']}, R2={res['r_squared']:.4f}):")
-            print(f"    Slope: {format_coef(res['coefficients'], 'tournament_year')}")
+        print(f"\n  {nation} (n={res['n']}, R2={res['r_squared']:.4f}):")
+        print(f"    Slope: {format_coef(res['coefficients'], 'tournament_year')}")
 
     return results
 
@@ -303,19 +473,24 @@ def table6_regional_anova(df: pd.DataFrame) -> dict:
     regions = sorted(subset["region"].unique())
     print(f"  Regions: {regions}")
 
-    # Overall ANOVA
-    groups = [
-        subset[subset["region"] == r]["height_cm"].values
-        for r in regions
-        if len(subset[subset["region"] == r]) >= 2
-    ]
-    valid_regions = [
-        r for r in regions
-        if len(subset[subset["region"] == r]) >= 2
-    ]
-
-    if len(groups) >= 2:
-        f_stat, p_value = stats.f_oneway(*groups)
+    # Per-region sufficient statistics, computed once and reused for both
+    # the one-way ANOVA and the pairwise fallback below
+    region_suff = subset.groupby("region")["height_cm"].agg(
+        ["count", "mean", "var"]
+    ).sort_index()
+    region_suff = region_suff[region_suff["count"] >= 2]
+    valid_regions = list(region_suff.index)
+
+    if len(valid_regions) >= 2:
+        cnt, m, v = region_suff.to_numpy().T
+        k = len(valid_regions)
+        grand_mean = (cnt * m).sum() / cnt.sum()
+        ss_between = (cnt * (m - grand_mean) ** 2).sum()
+        ss_within = ((cnt - 1) * v).sum()
+        df_b = k - 1
+        df_w = cnt.sum() - k
+        f_stat = (ss_between / df_b) / (ss_within / df_w)
+        p_value = stats.f.sf(f_stat, df_b, df_w)
         print(f"\n  One-way ANOVA: F={f_stat:.4f}, p={p_value:.6f}")
         results["overall_anova"] = {
             "f_statistic": round(float(f_stat), 4),
@@ -342,16 +517,26 @@ def table6_regional_anova(df: pd.DataFrame) -> dict:
             except Exception as e:
                 print(f"    Post-hoc error: {e}")
         else:
-            # Manual Bonferroni t-tests
+            # Manual Bonferroni t-tests -- Welch's t and Satterthwaite df
+            # for every pair at once via broadcasting over the per-region
+            # count/mean/var table, instead of rescanning the arrays per pair
             print("\n  --- Pairwise t-tests (Bonferroni corrected) ---")
             n_comparisons = len(valid_regions) * (len(valid_regions) - 1) // 2
+            vn = v / cnt
+            se_sq = vn[:, None] + vn[None, :]
+            t_mat = (m[:, None] - m[None, :]) / np.sqrt(se_sq)
+            df_mat = se_sq ** 2 / (
+                (vn[:, None]) ** 2 / (cnt[:, None] - 1)
+                + (vn[None, :]) ** 2 / (cnt[None, :] - 1)
+            )
+            p_mat = 2 * stats.t.sf(np.abs(t_mat), df_mat)
+
             pairwise_results = []
             for i, r1 in enumerate(valid_regions):
-                for r2 in valid_regions[i + 1:]:
-                    g1 = subset[subset["region"] == r1]["height_cm"]
-                    g2 = subset[subset["region"] == r2]["height_cm"]
-                    t, p = stats.ttest_ind(g1, g2, equal_var=False)
-                    p_adj = min(p * n_comparisons, 1.0)
+                for j in range(i + 1, len(valid_regions)):
+                    r2 = valid_regions[j]
+                    t = t_mat[i, j]
+                    p_adj = min(p_mat[i, j] * n_comparisons, 1.0)
                     sig = "*" if p_adj < 0.05 else ""
                     print(f"    {r1} vs {r2}: t={t:.3f}, p_adj={p_adj:.4f} {sig}")
                     pairwise_results.append({
@@ -373,14 +558,30 @@ def table6_regional_anova(df: pd.DataFrame) -> dict:
     return results
 
 
-def table7_breakpoint(df: pd.DataFrame) -> dict:
+def _segment_rss(xv: np.ndarray, yv: np.ndarray) -> float:
+    """Residual sum of squares of a simple OLS fit, in closed form."""
+    xbar = xv.mean()
+    dx = xv - xbar
+    dy = yv - yv.mean()
+    sxx = dx @ dx
+    syy = dy @ dy
+    if sxx == 0:
+        return float(syy)
+    sxy = dx @ dy
+    return float(syy - sxy * sxy / sxx)
+
+
+if HAS_NUMBA:
+    # The breakpoint scan calls this kernel twice per candidate year;
+    # LLVM-compiling it removes the remaining Python dispatch. The plain
+    # numpy version above is the drop-in fallback.
+    _segment_rss = njit(cache=True, fastmath=True)(_segment_rss)
+
+
+def table7_breakpoint(df: pd.DataFrame, cat_groups: dict) -> dict:
     """Table 7: Segmented regression with Chow test for breakpoint."""
     print_header("TABLE 7: Breakpoint Analysis (Segmented Regression + Chow Test)")
 
-    if not HAS_STATSMODELS:
-        print("  Skipped: statsmodels not available.")
-        return {}
-
     results = {}
     candidate_years = [1996, 1999, 2003, 2007, 2010, 2012]
 
@@ -388,9 +589,7 @@ def table7_breakpoint(df: pd.DataFrame) -> dict:
         if cat == "ALL":
             subset = df.dropna(subset=["height_cm", "tournament_year"])
         else:
-            subset = df[df["category"] == cat].dropna(
-                subset=["height_cm", "tournament_year"]
-            )
+            subset = cat_groups.get(cat, df.iloc[0:0])
 
         if len(subset) < 10:
             print(f"\n  {cat}: Insufficient data")
@@ -402,54 +601,52 @@ def table7_breakpoint(df: pd.DataFrame) -> dict:
         best_f = -1
         best_p = 1.0
 
-        for bp in candidate_years:
-            pre = subset[subset["tournament_year"] <= bp]
-            post = subset[subset["tournament_year"] > bp]
+        # Sort once per category; the full-model RSS does not change with
+        # the candidate breakpoint, and each split is a searchsorted slice
+        # of the sorted arrays with a closed-form RSS per half
+        order = subset["tournament_year"].to_numpy(dtype=float).argsort(kind="stable")
+        years = subset["tournament_year"].to_numpy(dtype=float)[order]
+        heights = subset["height_cm"].to_numpy(dtype=float)[order]
+        rss_full = _segment_rss(years, heights)
+        n = len(subset)
 
-            if len(pre) < 5 or len(post) < 5:
+        for bp in candidate_years:
+            split = np.searchsorted(years, bp, side="right")
+            if split < 5 or n - split < 5:
                 continue
 
-            # Full model (pooled)
-            try:
-                model_full = smf.ols("height_cm ~ tournament_year", data=subset).fit()
-                rss_full = model_full.ssr
-
-                # Restricted models (separate regressions)
-                model_pre = smf.ols("height_cm ~ tournament_year", data=pre).fit()
-                model_post = smf.ols("height_cm ~ tournament_year", data=post).fit()
-                rss_restricted = model_pre.ssr + model_post.ssr
-
-                # Chow test
-                k = 2  # number of parameters
-                n = len(subset)
-                f_stat = ((rss_full - rss_restricted) / k) / (rss_restricted / (n - 2 * k))
-                p_value = 1 - stats.f.cdf(f_stat, k, n - 2 * k)
+            rss_restricted = (
+                _segment_rss(years[:split], heights[:split])
+                + _segment_rss(years[split:], heights[split:])
+            )
 
-                sig = "*" if p_value < 0.05 else ""
-                print(f"    Breakpoint {bp}: F={f_stat:.4f}, p={p_value:.4f} {sig}")
+            # Chow test
+            k = 2  # number of parameters
+            f_stat = ((rss_full - rss_restricted) / k) / (rss_restricted / (n - 2 * k))
+            p_value = 1 - stats.f.cdf(f_stat, k, n - 2 * k)
 
-                if f_stat > best_f:
-                    best_f = f_stat
-                    best_p = p_value
-                    best_bp = bp
+            sig = "*" if p_value < 0.05 else ""
+            print(f"    Breakpoint {bp}: F={f_stat:.4f}, p={p_value:.4f} {sig}")
 
-            except Exception as e:
-                print(f"    Breakpoint {bp}: Error - {e}")
+            if f_stat > best_f:
+                best_f = f_stat
+                best_p = p_value
+                best_bp = bp
 
         if best_bp:
             results[cat] = {
                 "best_breakpoint": best_bp,
                 "f_statistic": round(float(best_f), 4),
                 "p_value": round(float(best_p), 6),
-                "significant": best_p < 0.05,
+                "significant": bool(best_p < 0.05),
             }
             print(f"    >>> Best breakpoint: {best_bp} (F={best_f:.4f}, p={best_p:.4f})")
 
             # Segmented regression details
             pre = subset[subset["tournament_year"] <= best_bp]
             post = subset[subset["tournament_year"] > best_bp]
-            res_pre = safe_ols("height_cm ~ tournament_year", pre)
-            res_post = safe_ols("height_cm ~ tournament_year", post)
+            res_pre = fast_ols_year(pre)
+            res_post = fast_ols_year(post)
             if res_pre:
                 print(f"    Pre-{best_bp} slope: "
                       f"{format_coef(res_pre['coefficients'], 'tournament_year')}")
@@ -519,6 +716,40 @@ def table8_two_way_anova(df: pd.DataFrame) -> dict:
     return results
 
 
+def _design_matrix(subset: pd.DataFrame, numeric_cols: list) -> pd.DataFrame:
+    """Fixed-effects design matrix: intercept, numeric terms, category dummies.
+
+    Fills one preallocated float64 array instead of the former
+    get_dummies -> copy -> insert chain, which reallocated the frame
+    three times. Column names match the old layout so the MixedLM
+    summary and JSON keys are unchanged.
+    """
+    cats = list(subset["category"].cat.categories)
+    codes = subset["category"].cat.codes.to_numpy()
+    k = len(cats) - 1  # first category is the dropped reference level
+    X = np.empty((len(subset), 1 + len(numeric_cols) + k))
+    X[:, 0] = 1.0
+    for j, col in enumerate(numeric_cols):
+        X[:, 1 + j] = subset[col].to_numpy(dtype=np.float64)
+    for i in range(k):
+        X[:, 1 + len(numeric_cols) + i] = codes == (i + 1)
+    columns = (["Intercept"] + numeric_cols
+               + [f"category_{c}" for c in cats[1:]])
+    return pd.DataFrame(X, index=subset.index, columns=columns)
+
+
+def _blas_all_cores():
+    """Context letting BLAS dot/solve use every core during a model fit.
+
+    MixedLM spends nearly all its time in BLAS, and some installs pin it
+    to one thread when driven from pandas/statsmodels. No-op without
+    threadpoolctl.
+    """
+    if HAS_THREADPOOLCTL:
+        return threadpool_limits(limits=os.cpu_count(), user_api="blas")
+    return nullcontext()
+
+
 def table9_mixed_effects(df: pd.DataFrame) -> dict:
     """Table 9: Mixed-effects model with Nation as random intercept."""
     print_header("TABLE 9: Mixed-Effects Model (Nation as Random Intercept)")
@@ -543,20 +774,14 @@ def table9_mixed_effects(df: pd.DataFrame) -> dict:
         # Model 1: Random intercept for nation
         print("\n  Model 1: height ~ year + category (random intercept: country)")
         subset_m1 = subset.dropna(subset=["height_cm", "tournament_year", "category"])
-        # Create dummy variables for category
-        subset_m1 = pd.get_dummies(subset_m1, columns=["category"], drop_first=True, dtype=float)
 
-        cat_cols = [c for c in subset_m1.columns if c.startswith("category_")]
-        formula_vars = ["tournament_year"] + cat_cols
-        exog_cols = ["tournament_year"] + cat_cols
-
-        X = subset_m1[exog_cols].copy()
-        X.insert(0, "Intercept", 1.0)
+        X = _design_matrix(subset_m1, ["tournament_year"])
         y = subset_m1["height_cm"]
         groups = subset_m1["country"]
 
         model = MixedLM(y, X, groups=groups)
-        fit = model.fit(reml=True)
+        with _blas_all_cores():
+            fit = model.fit(reml=True)
         print(fit.summary())
 
         results["model1"] = {
@@ -564,8 +789,8 @@ def table9_mixed_effects(df: pd.DataFrame) -> dict:
             "n": int(fit.nobs),
             "n_groups": int(fit.k_re),
             "log_likelihood": round(float(fit.llf), 4),
-            "aic": round(float(fit.aic), 4),
-            "bic": round(float(fit.bic), 4),
+            "aic": round(float(fit.aic), 4) if np.isfinite(fit.aic) else None,
+            "bic": round(float(fit.bic), 4) if np.isfinite(fit.bic) else None,
             "fixed_effects": {},
         }
         for param in fit.fe_params.index:
@@ -581,25 +806,29 @@ def table9_mixed_effects(df: pd.DataFrame) -> dict:
         if len(subset_m2) >= 10 and subset_m2["country"].nunique() >= 2:
             print("\n  Model 2: height ~ year + pop_height + category "
                   "(random intercept: country)")
-            subset_m2 = pd.get_dummies(subset_m2, columns=["category"], drop_first=True, dtype=float)
-            cat_cols2 = [c for c in subset_m2.columns if c.startswith("category_")]
-            exog_cols2 = ["tournament_year", "pop_height_birth_cohort"] + cat_cols2
-
-            X2 = subset_m2[exog_cols2].copy()
-            X2.insert(0, "Intercept", 1.0)
+            X2 = _design_matrix(
+                subset_m2, ["tournament_year", "pop_height_birth_cohort"]
+            )
             y2 = subset_m2["height_cm"]
             groups2 = subset_m2["country"]
 
+            # Model 2 shares Model 1's random structure, so its fitted
+            # random-intercept variance is a much better starting point
+            # than the default rough OLS-based values
+            start = MixedLMParams.from_components(
+                fe_params=None, cov_re=fit.cov_re.values / fit.scale
+            )
             model2 = MixedLM(y2, X2, groups=groups2)
-            fit2 = model2.fit(reml=True)
+            with _blas_all_cores():
+                fit2 = model2.fit(reml=True, start_params=start)
             print(fit2.summary())
 
             results["model2"] = {
                 "converged": fit2.converged,
                 "n": int(fit2.nobs),
                 "log_likelihood": round(float(fit2.llf), 4),
-                "aic": round(float(fit2.aic), 4),
-                "bic": round(float(fit2.bic), 4),
+                "aic": round(float(fit2.aic), 4) if np.isfinite(fit2.aic) else None,
+                "bic": round(float(fit2.bic), 4) if np.isfinite(fit2.bic) else None,
             }
 
     except Exception as e:
@@ -610,17 +839,24 @@ def table9_mixed_effects(df: pd.DataFrame) -> dict:
     return results
 
 
-def table10_sensitivity(df: pd.DataFrame) -> dict:
+def table10_sensitivity(df: pd.DataFrame, cat_groups: dict) -> dict:
     """Sensitivity analyses."""
     print_header("TABLE 10: Sensitivity Analyses")
 
     results = {}
 
+    # Hoisted subsets: the format masks and per-category height pulls
+    # below would otherwise each rescan the full frame
+    by_fmt = {f: g for f, g in df.groupby("format", observed=True, sort=False)}
+    cat_heights = {
+        cat: g["height_cm"].to_numpy(np.float64) for cat, g in cat_groups.items()
+    }
+
     # 1. Verified-only analysis
     print("\n  --- 1. Verified heights only ---")
     verified = df[df["height_verified"] == True]
     if len(verified) > 0:
-        res = safe_ols("height_cm ~ tournament_year", verified)
+        res = fast_ols_year(verified)
         if res:
             print(f"    n={res['n']}, R2={res['r_squared']:.4f}")
             print(f"    Slope: {format_coef(res['coefficients'], 'tournament_year')}")
@@ -628,9 +864,9 @@ def table10_sensitivity(df: pd.DataFrame) -> dict:
 
     # 2. Exclude flagged players
     print("\n  --- 2. Exclude flagged players ---")
-    unflagged = df[df["flag"].isna() | (df["flag"] == "")]
+    unflagged = df[df["flag"].isna()]
     if len(unflagged) > 0:
-        res = safe_ols("height_cm ~ tournament_year", unflagged)
+        res = fast_ols_year(unflagged)
         if res:
             print(f"    n={res['n']}, R2={res['r_squared']:.4f}")
             print(f"    Slope: {format_coef(res['coefficients'], 'tournament_year')}")
@@ -638,9 +874,9 @@ def table10_sensitivity(df: pd.DataFrame) -> dict:
 
     # 3. ODI-only analysis
     print("\n  --- 3. ODI format only ---")
-    odi = df[df["format"] == "ODI"]
+    odi = by_fmt.get("ODI", df.iloc[0:0])
     if len(odi) >= 5:
-        res = safe_ols("height_cm ~ tournament_year", odi)
+        res = fast_ols_year(odi)
         if res:
             print(f"    n={res['n']}, R2={res['r_squared']:.4f}")
             print(f"    Slope: {format_coef(res['coefficients'], 'tournament_year')}")
@@ -648,9 +884,9 @@ def table10_sensitivity(df: pd.DataFrame) -> dict:
 
     # 4. T20-only analysis
     print("\n  --- 4. T20 format only ---")
-    t20 = df[df["format"] == "T20"]
+    t20 = by_fmt.get("T20", df.iloc[0:0])
     if len(t20) >= 5:
-        res = safe_ols("height_cm ~ tournament_year", t20)
+        res = fast_ols_year(t20)
         if res:
             print(f"    n={res['n']}, R2={res['r_squared']:.4f}")
             print(f"    Slope: {format_coef(res['coefficients'], 'tournament_year')}")
@@ -660,21 +896,25 @@ def table10_sensitivity(df: pd.DataFrame) -> dict:
     print("\n  --- 5. ODI vs T20 comparison (2007+ only) ---")
     recent = df[df["tournament_year"] >= 2007].dropna(subset=["height_cm"])
     if len(recent) >= 5 and recent["format"].nunique() >= 2:
-        odi_heights = recent[recent["format"] == "ODI"]["height_cm"]
-        t20_heights = recent[recent["format"] == "T20"]["height_cm"]
+        odi_heights = odi.loc[odi["tournament_year"] >= 2007, "height_cm"].dropna()
+        t20_heights = t20.loc[t20["tournament_year"] >= 2007, "height_cm"].dropna()
         if len(odi_heights) >= 3 and len(t20_heights) >= 3:
-            t, p = stats.ttest_ind(odi_heights, t20_heights, equal_var=False)
-            d = (odi_heights.mean() - t20_heights.mean()) / np.sqrt(
-                (odi_heights.std() ** 2 + t20_heights.std() ** 2) / 2
-            )
-            print(f"    ODI:  mean={odi_heights.mean():.2f}, n={len(odi_heights)}")
-            print(f"    T20:  mean={t20_heights.mean():.2f}, n={len(t20_heights)}")
+            # The means/stds feed the display, Cohen's d AND the t-test;
+            # computing them once and using ttest_ind_from_stats avoids
+            # rescanning both arrays inside scipy
+            m1, s1, n1 = odi_heights.mean(), odi_heights.std(), len(odi_heights)
+            m2, s2, n2 = t20_heights.mean(), t20_heights.std(), len(t20_heights)
+            t, p = stats.ttest_ind_from_stats(m1, s1, n1, m2, s2, n2,
+                                              equal_var=False)
+            d = (m1 - m2) / np.sqrt((s1 ** 2 + s2 ** 2) / 2)
+            print(f"    ODI:  mean={m1:.2f}, n={n1}")
+            print(f"    T20:  mean={m2:.2f}, n={n2}")
             print(f"    t={t:.4f}, p={p:.4f}, Cohen's d={d:.4f}")
             results["format_comparison"] = {
-                "odi_mean": round(float(odi_heights.mean()), 2),
-                "odi_n": int(len(odi_heights)),
-                "t20_mean": round(float(t20_heights.mean()), 2),
-                "t20_n": int(len(t20_heights)),
+                "odi_mean": round(float(m1), 2),
+                "odi_n": int(n1),
+                "t20_mean": round(float(m2), 2),
+                "t20_n": int(n2),
                 "t_statistic": round(float(t), 4),
                 "p_value": round(float(p), 6),
                 "cohens_d": round(float(d), 4),
@@ -682,20 +922,23 @@ def table10_sensitivity(df: pd.DataFrame) -> dict:
 
     # 6. Effect size: FAST vs BAT
     print("\n  --- 6. FAST vs BAT effect size ---")
-    fast = df[df["category"] == "FAST"]["height_cm"].dropna()
-    bat = df[df["category"] == "BAT"]["height_cm"].dropna()
+    fast = cat_heights.get("FAST", np.empty(0))
+    bat = cat_heights.get("BAT", np.empty(0))
     if len(fast) >= 3 and len(bat) >= 3:
-        diff = fast.mean() - bat.mean()
-        pooled_sd = np.sqrt((fast.std() ** 2 + bat.std() ** 2) / 2)
+        m1, s1, n1 = fast.mean(), fast.std(ddof=1), fast.size
+        m2, s2, n2 = bat.mean(), bat.std(ddof=1), bat.size
+        diff = m1 - m2
+        pooled_sd = np.sqrt((s1 ** 2 + s2 ** 2) / 2)
         d = diff / pooled_sd if pooled_sd > 0 else 0
-        t, p = stats.ttest_ind(fast, bat, equal_var=False)
-        print(f"    FAST: mean={fast.mean():.2f}, sd={fast.std():.2f}, n={len(fast)}")
-        print(f"    BAT:  mean={bat.mean():.2f}, sd={bat.std():.2f}, n={len(bat)}")
+        t, p = stats.ttest_ind_from_stats(m1, s1, n1, m2, s2, n2,
+                                          equal_var=False)
+        print(f"    FAST: mean={m1:.2f}, sd={s1:.2f}, n={n1}")
+        print(f"    BAT:  mean={m2:.2f}, sd={s2:.2f}, n={n2}")
         print(f"    Difference: {diff:.2f} cm, Cohen's d={d:.4f}")
         print(f"    t={t:.4f}, p={p:.6f}")
         results["fast_vs_bat"] = {
-            "fast_mean": round(float(fast.mean()), 2),
-            "bat_mean": round(float(bat.mean()), 2),
+            "fast_mean": round(float(m1), 2),
+            "bat_mean": round(float(m2), 2),
             "difference": round(float(diff), 2),
             "cohens_d": round(float(d), 4),
             "t_statistic": round(float(t), 4),
@@ -710,13 +953,24 @@ def table10_sensitivity(df: pd.DataFrame) -> dict:
 # ---------------------------------------------------------------------------
 
 def main():
-    if not MERGED_CSV.exists():
-        print(f"ERROR: Merged CSV not found: {MERGED_CSV}")
+    if not MERGED_PARQUET.exists() and not MERGED_CSV.exists():
+        print(f"ERROR: Merged player file not found: {MERGED_PARQUET}")
         print("       Run merge_all_tournaments.py first.")
         sys.exit(1)
 
-    df = pd.read_csv(MERGED_CSV)
-    print(f"Loaded {len(df)} player-tournament records from {MERGED_CSV}")
+    # Prefer the Parquet output (the merge step's primary file); fall back
+    # to the CSV when only it exists or no Parquet engine is installed
+    if MERGED_PARQUET.exists():
+        try:
+            df = pd.read_parquet(MERGED_PARQUET)
+            loaded_from = MERGED_PARQUET
+        except ImportError:
+            df = pd.read_csv(MERGED_CSV)
+            loaded_from = MERGED_CSV
+    else:
+        df = pd.read_csv(MERGED_CSV)
+        loaded_from = MERGED_CSV
+    print(f"Loaded {len(df)} player-tournament records from {loaded_from}")
     print(f"Columns: {list(df.columns)}")
 
     # Ensure numeric types
@@ -729,6 +983,17 @@ def main():
     df_valid = df[df["height_cm"].notna()].copy()
     print(f"Records with valid height: {len(df_valid)}")
 
+    # Categorical dtypes: the tables mask and group on these columns
+    # dozens of times, and integer-code compares beat object-string scans
+    for col in ["category", "era", "country", "region", "format"]:
+        if col in df_valid.columns:
+            df_valid[col] = df_valid[col].astype("category")
+
+    # flag: fold empty strings into NaN so "unflagged" is a plain isna()
+    # over int8 codes rather than an object-column compare in Table 10
+    if "flag" in df_valid.columns:
+        df_valid["flag"] = df_valid["flag"].replace("", np.nan).astype("category")
+
     if len(df_valid) == 0:
         print("ERROR: No records with valid height data.")
         sys.exit(1)
@@ -738,44 +1003,59 @@ def main():
     # ------------------------------------------------------------------
     all_results = {}
 
+    # Per-category subsets with valid year data, built in one groupby pass
+    # and shared by Tables 4, 7 and 10
+    cat_groups = {
+        cat: g.dropna(subset=["height_cm", "tournament_year"])
+        for cat, g in df_valid.groupby("category", sort=False)
+    }
+
+    # Contiguous arrays for the closed-form regression path: extract the
+    # two hot columns once and slice them by category code, so Table 3
+    # never touches the BlockManager again
+    heights_arr = df_valid["height_cm"].to_numpy(np.float64)
+    years_arr = df_valid["tournament_year"].to_numpy(np.float64)
+    cat_codes = df_valid["category"].cat.codes.to_numpy()
+    cat_arrays = {
+        cat: (years_arr[cat_codes == code], heights_arr[cat_codes == code])
+        for code, cat in enumerate(df_valid["category"].cat.categories)
+    }
+
     all_results["table2_descriptive"] = table2_descriptive(df_valid)
-    all_results["table3_unadjusted"] = table3_unadjusted_regression(df_valid)
-    all_results["table4_adjusted"] = table4_adjusted_regression(df_valid)
+    all_results["table3_unadjusted"] = table3_unadjusted_regression(
+        cat_arrays, years_arr, heights_arr
+    )
+    all_results["table4_adjusted"] = table4_adjusted_regression(
+        df_valid, all_results["table3_unadjusted"]
+    )
     all_results["table5_country"] = table5_country_regression(df_valid)
     all_results["table6_regional"] = table6_regional_anova(df_valid)
-    all_results["table7_breakpoint"] = table7_breakpoint(df_valid)
+    all_results["table7_breakpoint"] = table7_breakpoint(df_valid, cat_groups)
     all_results["table8_two_way_anova"] = table8_two_way_anova(df_valid)
     all_results["table9_mixed_effects"] = table9_mixed_effects(df_valid)
-    all_results["table10_sensitivity"] = table10_sensitivity(df_valid)
+    all_results["table10_sensitivity"] = table10_sensitivity(df_valid, cat_groups)
 
     # ------------------------------------------------------------------
     # Save results
     # ------------------------------------------------------------------
     OUTPUT_JSON.parent.mkdir(parents=True, exist_ok=True)
 
-    # Convert any numpy types for JSON serialization
-    def convert_numpy(obj):
-        if isinstance(obj, (np.integer,)):
-            return int(obj)
-        elif isinstance(obj, (np.floating,)):
-            return float(obj)
-        elif isinstance(obj, np.ndarray):
-            return obj.tolist()
-        elif isinstance(obj, pd.Timestamp):
-            return str(obj)
-        elif isinstance(obj, (np.bool_,)):
-            return bool(obj)
-        return obj
-
-    class NumpyEncoder(json.JSONEncoder):
-        def default(self, obj):
-            converted = convert_numpy(obj)
-            if converted is not obj:
-                return converted
-            return super().default(obj)
-
-    with open(OUTPUT_JSON, "w", encoding="utf-8") as fh:
-        json.dump(all_results, fh, indent=2, cls=NumpyEncoder, default=str)
+    # The table helpers wrap every numeric leaf in float()/int() as they
+    # assemble their dicts, so either encoder serializes the tree
+    # directly -- no per-leaf Python dispatch. orjson writes the whole
+    # document in C (and would handle any stray numpy leaf natively via
+    # OPT_SERIALIZE_NUMPY); default=str stays as the safety net.
+    if HAS_ORJSON:
+        with open(OUTPUT_JSON, "wb") as fh:
+            fh.write(orjson.dumps(
+                all_results,
+                option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                        | orjson.OPT_NON_STR_KEYS),
+                default=str,
+            ))
+    else:
+        with open(OUTPUT_JSON, "w", encoding="utf-8") as fh:
+            json.dump(all_results, fh, indent=2, default=str)
 
     print(f"\n\nResults saved to: {OUTPUT_JSON}")
     print("Done.")
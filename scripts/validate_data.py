@@ -21,18 +21,44 @@ Exit code 0 if all files pass, 1 if any errors found.
 """
 
 import argparse
+import hashlib
 import json
+import os
+import pickle
+import re
 import sys
+from operator import itemgetter
+from functools import partial
+from multiprocessing import Pool
 from pathlib import Path
-from datetime import datetime
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import fastjsonschema
+    HAS_FASTJSONSCHEMA = True
+except ImportError:
+    HAS_FASTJSONSCHEMA = False
+
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-VALID_CATEGORIES = {"WK", "BAT", "FAST", "SPIN"}
-VALID_FLAGS = {
-    None,
+# The enum vocabularies are interned so that membership tests on
+# likewise-interned document strings hit CPython's pointer-equality
+# fast path before falling back to character comparison
+VALID_CATEGORIES = frozenset(map(sys.intern, {"WK", "BAT", "FAST", "SPIN"}))
+VALID_FLAGS = frozenset({None}) | frozenset(map(sys.intern, {
     "HEIGHT_ESTIMATED",
     "HEIGHT_CONFLICTING",
     "DOB_ESTIMATED",
@@ -40,11 +66,15 @@ VALID_FLAGS = {
     "CATEGORY_AMBIGUOUS",
     "LIMITED_APPEARANCES",
     "CAPTAIN",  # present in actual data
-}
-VALID_FORMATS = {"ODI", "T20"}
-VALID_NATIONS = {"AUS", "ENG", "IND", "PAK", "WI", "NZL", "SL", "RSA"}
-REQUIRED_TOURNAMENT_FIELDS = {"tournament_id", "format", "year", "host", "winner", "era"}
-REQUIRED_PLAYER_FIELDS = {
+}))
+VALID_FORMATS = frozenset(map(sys.intern, {"ODI", "T20"}))
+VALID_NATIONS = frozenset(
+    map(sys.intern, {"AUS", "ENG", "IND", "PAK", "WI", "NZL", "SL", "RSA"})
+)
+REQUIRED_TOURNAMENT_FIELDS = frozenset(
+    {"tournament_id", "format", "year", "host", "winner", "era"}
+)
+REQUIRED_PLAYER_FIELDS = frozenset({
     "player_id",
     "full_name",
     "category",
@@ -57,7 +87,7 @@ REQUIRED_PLAYER_FIELDS = {
     "height_source",
     "flag",
     "notes",
-}
+})
 # pop_height_birth_cohort is optional -- may be filled later by match_population.py
 
 HEIGHT_MIN = 150.0
@@ -65,6 +95,141 @@ HEIGHT_MAX = 220.0
 AGE_MIN = 15
 AGE_MAX = 45
 
+# Files above this size are streamed team-by-team via ijson (when
+# installed) instead of being parsed into one in-memory document
+_STREAM_THRESHOLD = 32 * 1024 * 1024
+
+# Format check only -- strptime re-interprets its format string on
+# every call, which is far too slow for a per-player check. Month and
+# day ranges are encoded in the pattern; calendar subtleties like
+# Feb 30 are not worth a datetime round-trip here.
+_DOB_RE = re.compile(r"^\d{4}-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])$")
+
+# JSON Schema mirror of the per-field *error* checks below (required
+# fields, enums, numeric ranges). fastjsonschema compiles it once into
+# straight-line code, so a well-formed file is cleared in a single pass
+# instead of ~15 dict probes and isinstance checks per player. The
+# schema is deliberately at least as strict as the hand-rolled checks:
+# a schema pass means none of the guarded checks could fire, and any
+# schema failure drops back to the hand-rolled path so every problem is
+# still reported individually.
+TOURNAMENT_SCHEMA = {
+    "type": "object",
+    "required": ["tournament", "teams"],
+    "properties": {
+        "tournament": {
+            "type": "object",
+            "required": sorted(REQUIRED_TOURNAMENT_FIELDS),
+            "properties": {
+                "format": {"enum": sorted(VALID_FORMATS)},
+                "year": {"type": "integer"},
+            },
+        },
+        "teams": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["playing_xi"],
+                "properties": {
+                    "playing_xi": {
+                        "type": "array",
+                        "minItems": 11,
+                        "maxItems": 11,
+                        "items": {
+                            "type": "object",
+                            "required": sorted(REQUIRED_PLAYER_FIELDS),
+                            "properties": {
+                                "category": {"enum": sorted(VALID_CATEGORIES)},
+                                "height_cm": {
+                                    "type": ["number", "null"],
+                                    "minimum": HEIGHT_MIN,
+                                    "maximum": HEIGHT_MAX,
+                                },
+                            },
+                        },
+                    },
+                },
+            },
+        },
+    },
+}
+
+if HAS_FASTJSONSCHEMA:
+    _SCHEMA_VALIDATOR = fastjsonschema.compile(TOURNAMENT_SCHEMA)
+else:
+    _SCHEMA_VALIDATOR = None
+
+
+def _build_structural_checker():
+    """Generate a specialized pass/fail checker with constants inlined.
+
+    This is the same trick fastjsonschema uses: emit straight-line
+    source for exactly this document shape (enum literals, ranges and
+    required-field sets baked in) and exec it once, so the fast path
+    exists even without the dependency. The checker only answers
+    "could any structural error check fire?" -- on False the hand-
+    rolled path runs and reports the details.
+    """
+    cats = "{" + ", ".join(repr(c) for c in sorted(VALID_CATEGORIES)) + "}"
+    fmts = "{" + ", ".join(repr(f) for f in sorted(VALID_FORMATS)) + "}"
+    src = f'''
+def _structurally_ok(data):
+    t = data.get("tournament")
+    teams = data.get("teams")
+    if type(t) is not dict or type(teams) is not list or not teams:
+        return False
+    if not _REQ_T <= t.keys():
+        return False
+    if t.get("format") not in {fmts}:
+        return False
+    if type(t.get("year")) is not int:
+        return False
+    for team in teams:
+        if type(team) is not dict:
+            return False
+        xi = team.get("playing_xi")
+        if type(xi) is not list or len(xi) != 11:
+            return False
+        for p in xi:
+            if type(p) is not dict:
+                return False
+            if not _REQ_P <= p.keys():
+                return False
+            if p["category"] not in {cats}:
+                return False
+            h = p["height_cm"]
+            if h is not None:
+                if type(h) is not int and type(h) is not float:
+                    return False
+                if h < {HEIGHT_MIN!r} or h > {HEIGHT_MAX!r}:
+                    return False
+    return True
+'''
+    ns = {
+        "_REQ_T": REQUIRED_TOURNAMENT_FIELDS,
+        "_REQ_P": REQUIRED_PLAYER_FIELDS,
+    }
+    exec(src, ns)
+    return ns["_structurally_ok"]
+
+
+_STRUCTURAL_CHECKER = _build_structural_checker()
+
+# One C-level multi-key pull per player instead of nine .get() dispatch
+# calls; a KeyError (missing field) drops back to per-field .get
+_PLAYER_GETTER = itemgetter(
+    "player_id",
+    "category",
+    "height_cm",
+    "birth_year",
+    "age_at_tournament",
+    "date_of_birth",
+    "flag",
+    "batting_position",
+    "height_verified",
+)
+
 
 # ---------------------------------------------------------------------------
 # Validation helpers
@@ -98,50 +263,24 @@ class ValidationResult:
         return " | ".join(parts)
 
 
-def validate_file(filepath: str, strict: bool = False) -> ValidationResult:
-    """Validate a single tournament JSON file and return results."""
-
-    result = ValidationResult(filepath)
-
-    # ------------------------------------------------------------------
-    # 1. Load JSON
-    # ------------------------------------------------------------------
-    try:
-        with open(filepath, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
-    except json.JSONDecodeError as exc:
-        result.error(f"Invalid JSON: {exc}")
-        return result
-    except FileNotFoundError:
-        result.error("File not found")
-        return result
-
-    # ------------------------------------------------------------------
-    # 2. Top-level structure
-    # ------------------------------------------------------------------
-    if "tournament" not in data:
-        result.error("Missing top-level key 'tournament'")
-        return result
-    if "teams" not in data:
-        result.error("Missing top-level key 'teams'")
-        return result
-
-    tournament = data["tournament"]
-
-    # Tournament fields
-    missing_t = REQUIRED_TOURNAMENT_FIELDS - set(tournament.keys())
-    if missing_t:
-        result.error(f"Tournament missing fields: {missing_t}")
-
+def _validate_tournament(tournament: dict, result: ValidationResult,
+                         structural_ok: bool):
+    """Tournament-header checks; returns the tournament year (or None)."""
     tournament_year = tournament.get("year")
-    tournament_id = tournament.get("tournament_id", "<unknown>")
-    fmt = tournament.get("format")
 
-    if fmt and fmt not in VALID_FORMATS:
-        result.error(f"Invalid format '{fmt}'; expected one of {VALID_FORMATS}")
+    if not structural_ok:
+        # Tournament fields -- the keys view supports set ops directly,
+        # so the all-present case costs no set materialization
+        if not REQUIRED_TOURNAMENT_FIELDS <= tournament.keys():
+            missing_t = set(REQUIRED_TOURNAMENT_FIELDS - tournament.keys())
+            result.error(f"Tournament missing fields: {missing_t}")
 
-    if tournament_year is not None and not isinstance(tournament_year, int):
-        result.error(f"Tournament year must be int, got {type(tournament_year).__name__}")
+        fmt = tournament.get("format")
+        if fmt and fmt not in VALID_FORMATS:
+            result.error(f"Invalid format '{fmt}'; expected one of {set(VALID_FORMATS)}")
+
+        if tournament_year is not None and not isinstance(tournament_year, int):
+            result.error(f"Tournament year must be int, got {type(tournament_year).__name__}")
 
     # Era validation
     era = tournament.get("era")
@@ -161,141 +300,296 @@ def validate_file(filepath: str, strict: bool = False) -> ValidationResult:
                 f"{expected_era}, but era={era}"
             )
 
-    # ------------------------------------------------------------------
-    # 3. Teams
-    # ------------------------------------------------------------------
-    teams = data["teams"]
-    if not isinstance(teams, list):
-        result.error("'teams' must be a list")
+    return tournament_year
+
+
+def _validate_team(team: dict, team_idx: int, tournament_year,
+                   strict: bool, structural_ok: bool,
+                   result: ValidationResult,
+                   seen_all: set, cross_team_dups: list):
+    """Validate one team block, updating ``result`` and the duplicate sets."""
+    nation = team.get("nation", f"<team-{team_idx}>")
+    if type(nation) is str:
+        nation = sys.intern(nation)
+
+    # Validate nation code
+    if nation not in VALID_NATIONS:
+        if strict:
+            result.error(f"Team '{nation}' is not a valid nation code")
+        else:
+            result.warn(f"Team '{nation}' is not in the standard 8-nation set")
+
+    playing_xi = team.get("playing_xi")
+    if playing_xi is None:
+        result.error(f"[{nation}] Missing 'playing_xi'")
+        return
+    if not isinstance(playing_xi, list):
+        result.error(f"[{nation}] 'playing_xi' must be a list")
+        return
+
+    # ---- 11 players ----
+    if not structural_ok and len(playing_xi) != 11:
+        result.error(
+            f"[{nation}] Expected 11 players, found {len(playing_xi)}"
+        )
+
+    # Counters
+    wk_count = 0
+    seen_team: set = set()
+    team_dups: list[str] = []
+
+    for p_idx, player in enumerate(playing_xi):
+        try:
+            (pid, cat, height, birth_year, age, dob, flag, bp, hv) = \
+                _PLAYER_GETTER(player)
+        except KeyError:
+            pid = player.get("player_id", f"<player-{p_idx}>")
+            cat = player.get("category")
+            height = player.get("height_cm")
+            birth_year = player.get("birth_year")
+            age = player.get("age_at_tournament")
+            dob = player.get("date_of_birth")
+            flag = player.get("flag")
+            bp = player.get("batting_position")
+            hv = player.get("height_verified")
+        # Interning the vocabulary fields lets the enum membership tests
+        # below short-circuit on identity and dedupes the ~90 copies of
+        # each value a tournament file carries
+        if type(cat) is str:
+            cat = sys.intern(cat)
+        if type(flag) is str:
+            flag = sys.intern(flag)
+
+        # Checks run cheapest-first, and a structurally broken record
+        # (missing fields) skips the remaining checks outright -- the
+        # None defaults would only cascade into redundant errors
+
+        # ---- Required fields ----
+        if not structural_ok and not REQUIRED_PLAYER_FIELDS <= player.keys():
+            missing_p = set(REQUIRED_PLAYER_FIELDS - player.keys())
+            result.error(f"[{nation}/{pid}] Missing fields: {missing_p}")
+            continue
+
+        # ---- Category ----
+        if not structural_ok and cat not in VALID_CATEGORIES:
+            result.error(f"[{nation}/{pid}] Invalid category '{cat}'")
+        if cat == "WK":
+            wk_count += 1
+
+        # ---- Batting position ----
+        # Always checked here: JSON Schema "integer" accepts integral
+        # floats (3.0), so a structural pass does not guarantee int.
+        if bp is not None:
+            if type(bp) is not int or bp < 1 or bp > 11:
+                result.error(f"[{nation}/{pid}] batting_position={bp} must be int in [1,11]")
+
+        # ---- Height ----
+        if height is None:
+            result.warn(f"[{nation}/{pid}] height_cm is null/missing")
+        elif not structural_ok:
+            # type() instead of isinstance: JSON scalars are never
+            # subclasses, and the exact-type compare skips the MRO walk
+            if type(height) is not int and type(height) is not float:
+                result.error(f"[{nation}/{pid}] height_cm must be numeric, got {type(height).__name__}")
+            elif height < HEIGHT_MIN or height > HEIGHT_MAX:
+                result.error(
+                    f"[{nation}/{pid}] height_cm={height} out of range "
+                    f"[{HEIGHT_MIN}, {HEIGHT_MAX}]"
+                )
+
+        # ---- Flag ----
+        if flag not in VALID_FLAGS:
+            if strict:
+                result.error(f"[{nation}/{pid}] Invalid flag '{flag}'")
+            else:
+                result.warn(f"[{nation}/{pid}] Non-standard flag '{flag}'")
+
+        # ---- height_verified type ----
+        if hv is not None and type(hv) is not bool:
+            result.warn(f"[{nation}/{pid}] height_verified should be bool, got {type(hv).__name__}")
+
+        # ---- DOB / age (regex last -- costliest check) ----
+        if birth_year is not None and tournament_year is not None:
+            approx_age = tournament_year - birth_year
+            if approx_age < AGE_MIN or approx_age > AGE_MAX:
+                result.error(
+                    f"[{nation}/{pid}] Approximate age {approx_age} out of "
+                    f"range [{AGE_MIN}, {AGE_MAX}]"
+                )
+
+        if dob is not None and dob != "":
+            if not _DOB_RE.match(str(dob)):
+                result.error(f"[{nation}/{pid}] date_of_birth '{dob}' is not YYYY-MM-DD")
+
+        # ---- Duplicate player_id tracking ----
+        if pid:
+            if pid in seen_team:
+                team_dups.append(pid)
+            else:
+                seen_team.add(pid)
+            if pid in seen_all:
+                cross_team_dups.append(pid)
+            else:
+                seen_all.add(pid)
+
+    # ---- Exactly 1 WK per team ----
+    if wk_count != 1:
+        result.error(
+            f"[{nation}] Expected exactly 1 WK, found {wk_count}"
+        )
+
+    # ---- Duplicate player_ids within team ----
+    for pid in team_dups:
+        result.error(f"[{nation}] Duplicate player_id '{pid}'")
+
+
+def _validate_file_streaming(filepath: str, strict: bool,
+                             result: ValidationResult) -> ValidationResult:
+    """ijson path for files too large to materialize at once.
+
+    Teams are validated and discarded one at a time, capping memory at
+    roughly a single team. The whole-document schema fast path does not
+    apply here, so every check runs hand-rolled (structural_ok=False).
+    """
+    try:
+        with open(filepath, "rb") as fh:
+            tournament = next(ijson.items(fh, "tournament", use_float=True), None)
+            if tournament is None:
+                result.error("Missing top-level key 'tournament'")
+                return result
+            tournament_year = _validate_tournament(tournament, result, False)
+
+            fh.seek(0)
+            seen_all: set = set()
+            cross_team_dups: list[str] = []
+            n_teams = 0
+            for team_idx, team in enumerate(
+                ijson.items(fh, "teams.item", use_float=True)
+            ):
+                _validate_team(
+                    team, team_idx, tournament_year, strict, False,
+                    result, seen_all, cross_team_dups,
+                )
+                n_teams += 1
+    except FileNotFoundError:
+        result.error("File not found")
+        return result
+    except (ijson.JSONError, ValueError) as exc:
+        result.error(f"Invalid JSON: {exc}")
         return result
 
-    if len(teams) == 0:
+    if n_teams == 0:
         result.error("No teams in file")
         return result
 
-    all_player_ids: list[str] = []
+    for pid in cross_team_dups:
+        result.warn(f"Duplicate player_id '{pid}' across teams in tournament")
 
-    for team_idx, team in enumerate(teams):
-        nation = team.get("nation", f"<team-{team_idx}>")
+    return result
 
-        # Validate nation code
-        if nation not in VALID_NATIONS:
-            if strict:
-                result.error(f"Team '{nation}' is not a valid nation code")
-            else:
-                result.warn(f"Team '{nation}' is not in the standard 8-nation set")
 
-        playing_xi = team.get("playing_xi")
-        if playing_xi is None:
-            result.error(f"[{nation}] Missing 'playing_xi'")
-            continue
-        if not isinstance(playing_xi, list):
-            result.error(f"[{nation}] 'playing_xi' must be a list")
-            continue
+def validate_file(filepath: str, strict: bool = False,
+                  emit_dir: str = None) -> ValidationResult:
+    """Validate a single tournament JSON file and return results.
 
-        # ---- 11 players ----
-        if len(playing_xi) != 11:
-            result.error(
-                f"[{nation}] Expected 11 players, found {len(playing_xi)}"
-            )
+    With ``emit_dir`` set, a passing file's parsed document is also
+    dumped there as a pickle so merge_all_tournaments.py can skip
+    re-parsing the JSON (--parsed).
+    """
 
-        # Counters
-        wk_count = 0
-        team_player_ids: list[str] = []
+    result = ValidationResult(filepath)
 
-        for p_idx, player in enumerate(playing_xi):
-            pid = player.get("player_id", f"<player-{p_idx}>")
-            label = f"[{nation}/{pid}]"
+    # Oversized files stream team-by-team instead of materializing the
+    # whole document (opt-in via ijson; the raw files here are tiny)
+    if HAS_IJSON:
+        try:
+            if os.path.getsize(filepath) > _STREAM_THRESHOLD:
+                return _validate_file_streaming(filepath, strict, result)
+        except OSError:
+            result.error("File not found")
+            return result
 
-            # ---- Required fields ----
-            missing_p = REQUIRED_PLAYER_FIELDS - set(player.keys())
-            if missing_p:
-                result.error(f"{label} Missing fields: {missing_p}")
+    # ------------------------------------------------------------------
+    # 1. Load JSON
+    # ------------------------------------------------------------------
+    # orjson parses several times faster than the stdlib and returns the
+    # same dict/list tree; its JSONDecodeError subclasses ValueError, so
+    # one handler covers both parsers
+    try:
+        with open(filepath, "rb") as fh:
+            raw = fh.read()
+        data = orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+    except ValueError as exc:
+        result.error(f"Invalid JSON: {exc}")
+        return result
+    except FileNotFoundError:
+        result.error("File not found")
+        return result
 
-            # ---- Category ----
-            cat = player.get("category")
-            if cat not in VALID_CATEGORIES:
-                result.error(f"{label} Invalid category '{cat}'")
-            if cat == "WK":
-                wk_count += 1
+    # ------------------------------------------------------------------
+    # 2. Top-level structure
+    # ------------------------------------------------------------------
+    # Compiled-schema fast path: one pass clears all the structural
+    # error checks at once. On failure, fall through with
+    # structural_ok=False so the hand-rolled path enumerates every
+    # problem (the compiled validator stops at the first).
+    structural_ok = False
+    if _SCHEMA_VALIDATOR is not None:
+        try:
+            _SCHEMA_VALIDATOR(data)
+            structural_ok = True
+        except fastjsonschema.JsonSchemaException:
+            pass
+    elif isinstance(data, dict):
+        structural_ok = _STRUCTURAL_CHECKER(data)
 
-            # ---- Height ----
-            height = player.get("height_cm")
-            if height is not None:
-                if not isinstance(height, (int, float)):
-                    result.error(f"{label} height_cm must be numeric, got {type(height).__name__}")
-                elif height < HEIGHT_MIN or height > HEIGHT_MAX:
-                    result.error(
-                        f"{label} height_cm={height} out of range "
-                        f"[{HEIGHT_MIN}, {HEIGHT_MAX}]"
-                    )
-            else:
-                result.warn(f"{label} height_cm is null/missing")
+    if "tournament" not in data:
+        result.error("Missing top-level key 'tournament'")
+        return result
+    if "teams" not in data:
+        result.error("Missing top-level key 'teams'")
+        return result
 
-            # ---- DOB / age ----
-            birth_year = player.get("birth_year")
-            age = player.get("age_at_tournament")
-            dob = player.get("date_of_birth")
+    tournament_year = _validate_tournament(data["tournament"], result, structural_ok)
 
-            if birth_year is not None and tournament_year is not None:
-                approx_age = tournament_year - birth_year
-                if approx_age < AGE_MIN or approx_age > AGE_MAX:
-                    result.error(
-                        f"{label} Approximate age {approx_age} out of "
-                        f"range [{AGE_MIN}, {AGE_MAX}]"
-                    )
-
-            if dob is not None and dob != "":
-                try:
-                    datetime.strptime(str(dob), "%Y-%m-%d")
-                except ValueError:
-                    result.error(f"{label} date_of_birth '{dob}' is not YYYY-MM-DD")
-
-            # ---- Flag ----
-            flag = player.get("flag")
-            if flag not in VALID_FLAGS:
-                if strict:
-                    result.error(f"{label} Invalid flag '{flag}'")
-                else:
-                    result.warn(f"{label} Non-standard flag '{flag}'")
+    # ------------------------------------------------------------------
+    # 3. Teams
+    # ------------------------------------------------------------------
+    teams = data["teams"]
+    if not isinstance(teams, list):
+        result.error("'teams' must be a list")
+        return result
 
-            # ---- Batting position ----
-            bp = player.get("batting_position")
-            if bp is not None:
-                if not isinstance(bp, int) or bp < 1 or bp > 11:
-                    result.error(f"{label} batting_position={bp} must be int in [1,11]")
+    if len(teams) == 0:
+        result.error("No teams in file")
+        return result
 
-            # ---- height_verified type ----
-            hv = player.get("height_verified")
-            if hv is not None and not isinstance(hv, bool):
-                result.warn(f"{label} height_verified should be bool, got {type(hv).__name__}")
-
-            # ---- Collect player_id for duplicate check ----
-            if pid:
-                team_player_ids.append(pid)
-                all_player_ids.append(pid)
-
-        # ---- Exactly 1 WK per team ----
-        if wk_count != 1:
-            result.error(
-                f"[{nation}] Expected exactly 1 WK, found {wk_count}"
-            )
+    # Duplicate tracking in one pass: running sets catch repeats as they
+    # appear instead of buffering every pid and rescanning afterwards
+    seen_all: set = set()
+    cross_team_dups: list[str] = []
 
-        # ---- Duplicate player_ids within team ----
-        seen = set()
-        for pid in team_player_ids:
-            if pid in seen:
-                result.error(f"[{nation}] Duplicate player_id '{pid}'")
-            seen.add(pid)
+    for team_idx, team in enumerate(teams):
+        _validate_team(
+            team, team_idx, tournament_year, strict, structural_ok,
+            result, seen_all, cross_team_dups,
+        )
 
     # ------------------------------------------------------------------
     # 4. Duplicate player_ids across teams (within tournament)
     # ------------------------------------------------------------------
-    seen_all = set()
-    for pid in all_player_ids:
-        if pid in seen_all:
-            result.warn(f"Duplicate player_id '{pid}' across teams in tournament")
-        seen_all.add(pid)
+    for pid in cross_team_dups:
+        result.warn(f"Duplicate player_id '{pid}' across teams in tournament")
+
+    # Share the parse with downstream stages: pickle round-trips a
+    # dict-of-primitives much faster than re-parsing the JSON
+    if emit_dir is not None and result.passed:
+        try:
+            out = Path(emit_dir) / (Path(filepath).name + ".pkl")
+            with open(out, "wb") as fh:
+                pickle.dump(data, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as exc:
+            result.warn(f"Could not emit parsed pickle: {exc}")
 
     return result
 
@@ -319,8 +613,30 @@ def main():
         default=False,
         help="Treat warnings as errors (stricter validation).",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of worker processes for validation (default: all cores).",
+    )
+    parser.add_argument(
+        "--cache",
+        default=".validation_cache.json",
+        help="Cache file keyed by content hash; unchanged files skip "
+             "re-validation (pass '' to disable).",
+    )
+    parser.add_argument(
+        "--emit-parsed",
+        default=None,
+        metavar="DIR",
+        help="Write each passing file's parsed document to DIR as a "
+             "pickle for merge_all_tournaments.py --parsed.",
+    )
     args = parser.parse_args()
 
+    if args.emit_parsed:
+        Path(args.emit_parsed).mkdir(parents=True, exist_ok=True)
+
     # Resolve file paths (glob may already be expanded by shell)
     filepaths: list[str] = []
     for f in args.files:
@@ -337,26 +653,75 @@ def main():
         print("ERROR: No files to validate.")
         sys.exit(1)
 
-    # Run validation
-    results: list[ValidationResult] = []
+    # Content-hash cache: a rerun only re-validates files whose bytes
+    # changed. Keyed on blake2b(content) plus the strict flag, since
+    # strict mode reclassifies warnings as errors.
+    cache: dict = {}
+    cache_path = Path(args.cache) if args.cache else None
+    if cache_path and cache_path.exists():
+        try:
+            cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (ValueError, OSError):
+            cache = {}
+
+    mode_key = "strict" if args.strict else "normal"
+    file_keys: list[str] = []
     for fp in filepaths:
-        res = validate_file(fp, strict=args.strict)
-        results.append(res)
-
-    # --------------- Print results ---------------
+        try:
+            digest = hashlib.blake2b(
+                Path(fp).read_bytes(), digest_size=16
+            ).hexdigest()
+        except OSError:
+            digest = ""
+        file_keys.append(f"{digest}:{mode_key}" if digest else "")
+
+    # Decide cached/fresh membership once, before any validation runs:
+    # merged_results also inserts fresh results into the cache, so
+    # re-probing the live cache inside the loop would flip duplicate-
+    # content inputs from fresh to cached mid-stream and desynchronize
+    # the fresh iterator.
+    use_cache = [bool(key) and key in cache for key in file_keys]
+    to_validate = [
+        fp for fp, cached in zip(filepaths, use_cache) if not cached
+    ]
+
+    validate_fn = partial(validate_file, strict=args.strict,
+                          emit_dir=args.emit_parsed)
+
+    def merged_results(fresh_iter):
+        """Interleave cached and freshly validated results in input order."""
+        for fp, key, cached in zip(filepaths, file_keys, use_cache):
+            if cached:
+                res = ValidationResult(fp)
+                res.errors = list(cache[key]["errors"])
+                res.warnings = list(cache[key]["warnings"])
+            else:
+                res = next(fresh_iter)
+                if key:
+                    cache[key] = {"errors": res.errors, "warnings": res.warnings}
+            yield res
+
+    # --------------- Print results (streamed) ---------------
+    # Each file's section prints as soon as its result is available and
+    # only running counters are kept, instead of buffering every
+    # ValidationResult and reporting at the end
     print("=" * 72)
     print("CRICKET DATA VALIDATION REPORT")
     print("=" * 72)
-    print(f"Files checked : {len(results)}")
+    print(f"Files checked : {len(filepaths)}")
     print(f"Mode          : {'STRICT' if args.strict else 'NORMAL'}")
     print("-" * 72)
 
     total_errors = 0
     total_warnings = 0
+    passed = 0
 
-    for res in results:
+    def report(res: ValidationResult):
+        nonlocal total_errors, total_warnings, passed
         total_errors += len(res.errors)
         total_warnings += len(res.warnings)
+        if res.passed:
+            passed += 1
 
         print(f"\n{res.summary_line()}")
         for e in res.errors:
@@ -364,9 +729,26 @@ def main():
         for w in res.warnings:
             print(f"    WARN : {w}")
 
+    # Validation -- files are fully independent (parse + pure-CPU
+    # checks, results just lists of strings), so big batches fan out
+    # across cores; small ones stay serial to skip the fork overhead.
+    # pool.imap streams results in input order as workers finish.
+    if args.jobs > 1 and len(to_validate) >= 4:
+        with Pool(processes=min(args.jobs, len(to_validate))) as pool:
+            for res in merged_results(pool.imap(validate_fn, to_validate)):
+                report(res)
+    else:
+        for res in merged_results(map(validate_fn, to_validate)):
+            report(res)
+
+    if cache_path:
+        try:
+            cache_path.write_text(json.dumps(cache), encoding="utf-8")
+        except OSError:
+            pass
+
     print("\n" + "=" * 72)
-    passed = sum(1 for r in results if r.passed)
-    failed = len(results) - passed
+    failed = len(filepaths) - passed
     print(f"SUMMARY: {passed} passed, {failed} failed")
     print(f"         {total_errors} error(s), {total_warnings} warning(s)")
     print("=" * 72)